@@ -36,6 +36,9 @@ mkdir -p "$INSTALL_DIR"
 echo "Copying source files..."
 cp -r "$SRC_DIR"/* "$INSTALL_DIR/"
 
+# Precompile bytecode so the first statusline render doesn't compile every module
+python3 -m compileall -q "$INSTALL_DIR" > /dev/null 2>&1 || true
+
 # Make scripts executable
 chmod +x "$INSTALL_DIR/statusline.py"
 chmod +x "$INSTALL_DIR/configure.py"
@@ -51,17 +54,8 @@ else
     echo "  sudo ln -sf $INSTALL_DIR/configure.py $SYMLINK_DIR/claude-statusline-config"
 fi
 
-# Create default config
-echo "Creating default configuration..."
-python3 "$(dirname "${BASH_SOURCE[0]}")/install_helper.py" create-config "$INSTALL_DIR"
-
-# Update Claude Code settings
-echo
-echo "Updating Claude Code settings..."
-
-python3 "$(dirname "${BASH_SOURCE[0]}")/install_helper.py" update-settings "$CLAUDE_SETTINGS"
-
-if [ $? -eq 0 ]; then
+# Create default config and update Claude Code settings (single Python process)
+if python3 "$(dirname "${BASH_SOURCE[0]}")/install_helper.py" install "$INSTALL_DIR" "$CLAUDE_SETTINGS"; then
     echo
     echo -e "${GREEN}✓ Installation complete!${NC}"
     echo
@@ -6,14 +6,24 @@ This script provides helper functions for the install.sh script:
 1. Create default configuration
 2. Update Claude Code settings.json
 
+The `install` command runs both steps in a single interpreter process.
+
 This file is not installed to the user's directory - it's only used during installation.
 """
 
-import json
 import os
+import stat
 import sys
 from pathlib import Path
 
+# Share the optional-orjson JSON helpers with the statusline sources.
+# Skip the path entry when src is already importable (e.g. under pytest).
+_SRC_DIR = str(Path(__file__).resolve().parent / "src")
+if _SRC_DIR not in sys.path:
+    sys.path.insert(0, _SRC_DIR)
+
+import json_utils
+
 
 def create_default_config(install_dir: str) -> int:
     """
@@ -55,10 +65,9 @@ def update_claude_settings(settings_file: Path) -> int:
         # Load existing settings or create new ones
         if settings_file.exists():
             try:
-                with open(settings_file, 'r') as f:
-                    settings = json.load(f)
+                settings = json_utils.loads(settings_file.read_bytes())
                 print(f"✓ Loaded existing settings from {settings_file}")
-            except json.JSONDecodeError:
+            except json_utils.JSONDecodeError:
                 settings = {}
                 print(f"Warning: Could not parse {settings_file}, creating new settings")
         else:
@@ -71,9 +80,22 @@ def update_claude_settings(settings_file: Path) -> int:
             "command": "~/.claude-code-statusline/statusline.py"
         }
 
-        # Save settings
-        with open(settings_file, 'w') as f:
-            json.dump(settings, f, indent=2)
+        # Save settings atomically so a failed write can't truncate the user's file
+        data = json_utils.dumps(settings)
+
+        # Replace the symlink target (e.g. dotfiles-managed settings), not the link
+        target_file = Path(os.path.realpath(str(settings_file)))
+        tmp_file = target_file.with_name(f"{target_file.name}.{os.getpid()}.tmp")
+        try:
+            tmp_file.write_bytes(data)
+            if target_file.exists():
+                # Keep the existing file's permissions
+                os.chmod(str(tmp_file), stat.S_IMODE(target_file.stat().st_mode))
+            os.replace(str(tmp_file), str(target_file))
+        except BaseException:
+            if tmp_file.exists():
+                tmp_file.unlink()
+            raise
 
         print(f"✓ Updated statusLine configuration in {settings_file}")
         return 0
@@ -83,24 +105,54 @@ def update_claude_settings(settings_file: Path) -> int:
         return 1
 
 
+def install(install_dir: str, settings_file: Path) -> int:
+    """
+    Create the default configuration and update Claude Code settings.
+
+    A failure to create the config is only a warning (it is created on first
+    run), so the result reflects the settings update.
+
+    Args:
+        install_dir: Path to the installation directory
+        settings_file: Path to the Claude Code settings.json file
+
+    Returns:
+        0 on success, 1 on failure
+    """
+    print("Creating default configuration...")
+    create_default_config(install_dir)
+
+    print()
+    print("Updating Claude Code settings...")
+    return update_claude_settings(settings_file)
+
+
 def main():
     """
     Main entry point for the installation helper.
 
     Usage:
+        python3 install_helper.py install <install_dir> <settings_file>
         python3 install_helper.py create-config <install_dir>
         python3 install_helper.py update-settings <settings_file>
     """
     if len(sys.argv) < 2:
         print("Usage: install_helper.py <command> [args]", file=sys.stderr)
         print("Commands:", file=sys.stderr)
+        print("  install <install_dir> <settings_file>", file=sys.stderr)
         print("  create-config <install_dir>", file=sys.stderr)
         print("  update-settings <settings_file>", file=sys.stderr)
         sys.exit(1)
 
     command = sys.argv[1]
 
-    if command == "create-config":
+    if command == "install":
+        if len(sys.argv) < 4:
+            print("Error: install requires install_dir and settings_file arguments", file=sys.stderr)
+            sys.exit(1)
+        sys.exit(install(sys.argv[2], Path(sys.argv[3])))
+
+    elif command == "create-config":
         if len(sys.argv) < 3:
             print("Error: create-config requires install_dir argument", file=sys.stderr)
             sys.exit(1)
@@ -1,7 +1,9 @@
 import os
-from typing import Dict, Optional
+import types
+from typing import Dict, Mapping, Optional, Tuple
 
-COLORS: Dict[str, str] = {
+# Read-only: _WRAP below is derived from it at import time
+COLORS: Mapping[str, str] = types.MappingProxyType({
     "cyan": "\033[96m",
     "green": "\033[92m",
     "blue": "\033[94m",
@@ -10,30 +12,48 @@ COLORS: Dict[str, str] = {
     "red": "\033[91m",
     "white": "\033[97m",
     "reset": "\033[0m"
+})
+
+# Precomputed (prefix, suffix) pairs so colorize() is a single dict lookup
+_WRAP: Dict[str, Tuple[str, str]] = {
+    name: (code, COLORS["reset"]) for name, code in COLORS.items()
 }
+_WRAP_EMPTY: Tuple[str, str] = ("", "")
 
 # Module-level override for color state (set by statusline.py)
 _color_override: Optional[bool] = None
 
+# Cached NO_COLOR check (the environment doesn't change during a statusline run)
+_color_cache: Optional[bool] = None
+
 def is_color_enabled() -> bool:
     """Check if colors should be used (respects NO_COLOR environment variable and override)."""
+    global _color_cache
     # Check override first (set by statusline when config disables colors)
     if _color_override is not None:
         return _color_override
-    # Fall back to NO_COLOR environment variable
-    return os.environ.get("NO_COLOR") is None
+    # Fall back to NO_COLOR environment variable, read once per process
+    if _color_cache is None:
+        _color_cache = os.environ.get("NO_COLOR") is None
+    return _color_cache
+
+def _invalidate_color_cache() -> None:
+    """Forget the cached NO_COLOR check (for tests that change the environment)."""
+    global _color_cache
+    _color_cache = None
 
 def colorize(text: str, color_name: str) -> str:
     """Wrap text in ANSI color codes."""
     if not is_color_enabled():
         return text
 
-    color_code = COLORS.get(color_name.lower(), "")
-    reset_code = COLORS["reset"]
-
-    if color_code:
-        return f"{color_code}{text}{reset_code}"
-    return text
+    wrap = _WRAP.get(color_name)
+    if wrap is None:
+        # Accept mixed-case names (e.g. "Cyan"); unknown names leave text unstyled
+        wrap = _WRAP.get(color_name.lower(), _WRAP_EMPTY)
+    prefix, suffix = wrap
+    # Plain concatenation is cheaper than an f-string for three short parts
+    return prefix + text + suffix
 
 def reset() -> str:
     """Return ANSI reset code."""
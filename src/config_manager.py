@@ -5,21 +5,119 @@ This module handles loading, saving, and validating user configuration.
 Uses constants module for all default values and validation.
 """
 
-import json
-import logging
+import copy
+import functools
+import hashlib
+import os
+import pickle
+import stat
+import sys
+import types
 from pathlib import Path
-from typing import Dict, Any, Optional
+from typing import Dict, Any, List, Mapping, Optional, Tuple
 
 import constants
+import json_utils
 from exceptions import ConfigurationError
 
-# Configure logger
-logger = logging.getLogger("claude_statusline.config")
+__all__ = [
+    "CONFIG_DIR",
+    "CONFIG_FILE",
+    "ConfigManager",
+    "get_default_config",
+    "validate_config",
+    "ensure_config_exists",
+    "load_config",
+    "save_config",
+]
 
-# Default configuration paths
-CONFIG_DIR = Path.home() / ".claude-code-statusline"
+# Logger name for configuration messages
+LOGGER_NAME = "claude_statusline.config"
+
+
+def _get_logger():
+    """
+    Return the configuration logger, importing logging on first use.
+
+    logging is only needed on warning/error paths, so a valid config never
+    pays its import cost.
+
+    Returns:
+        logging.Logger for configuration messages
+    """
+    import logging
+    return logging.getLogger(LOGGER_NAME)
+
+
+@functools.lru_cache(maxsize=1)
+def _config_dir() -> Path:
+    """
+    Return the default configuration directory.
+
+    Resolved once per process; Path.home() does environment and passwd lookups.
+
+    Returns:
+        Path to ~/.claude-code-statusline
+    """
+    return Path.home() / ".claude-code-statusline"
+
+
+# Default configuration paths (module attributes kept so tests can monkeypatch them)
+CONFIG_DIR = _config_dir()
 CONFIG_FILE = CONFIG_DIR / "config.json"
 
+# Suffix of the sidecar file holding the last validated config (e.g. config.cache.pickle)
+CACHE_FILE_SUFFIX = ".cache.pickle"
+
+# Bump when the sidecar cache layout changes. Changes to defaults or validation
+# rules are picked up automatically through the schema digest (_CACHE_VERSION).
+CACHE_FORMAT_VERSION = 2
+
+# Cache entry: (stat stamp, content digest, validated config)
+_CacheEntry = Tuple[Optional[Tuple[int, int]], str, Dict[str, Any]]
+
+# In-process cache: config file path -> cache entry
+_load_cache: Dict[str, _CacheEntry] = {}
+
+
+def _content_digest(raw: bytes) -> str:
+    """
+    Return a short digest of raw config file contents.
+
+    Args:
+        raw: Config file bytes
+
+    Returns:
+        Hex digest (BLAKE2b, 64-bit)
+    """
+    return hashlib.blake2b(raw, digest_size=8).hexdigest()
+
+
+def _intern_keys(config: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Return a copy of a config whose key strings are interned.
+
+    Keys parsed from JSON or unpickled are fresh string objects, while the
+    field/icon/color names in constants are interned literals. Interning the
+    keys (and field_order names) lets every per-render lookup match on
+    identity instead of comparing characters.
+
+    Args:
+        config: Validated configuration dictionary
+
+    Returns:
+        Configuration dictionary with interned keys
+    """
+    intern = sys.intern
+    interned = {}
+    for key, value in config.items():
+        if isinstance(value, dict):
+            value = {intern(k): v for k, v in value.items()}
+        elif key == constants.CONFIG_KEY_FIELD_ORDER:
+            value = [intern(name) for name in value]
+        interned[intern(key)] = value
+    return interned
+
 
 class ConfigManager:
     """
@@ -43,6 +141,10 @@ class ConfigManager:
         # Check CONFIG_FILE at runtime to support testing with monkeypatch
         self.config_file = config_file if config_file is not None else CONFIG_FILE
         self.config_dir = self.config_file.parent
+        self.cache_file = self.config_file.with_suffix(CACHE_FILE_SUFFIX)
+        # Plain string paths for open()/os.stat() in the hot path
+        self._config_file_str = str(self.config_file)
+        self._cache_file_str = str(self.cache_file)
         self._config: Optional[Dict[str, Any]] = None
 
     @staticmethod
@@ -64,59 +166,46 @@ class ConfigManager:
             "enable_colors": constants.DEFAULT_ENABLE_COLORS
         }
 
-    def validate(self, config: Dict[str, Any]) -> Dict[str, Any]:
+    @staticmethod
+    def get_default_config_readonly() -> Mapping[str, Any]:
+        """
+        Return a shared, read-only view of the default configuration.
+
+        Use this instead of get_default_config() when only reading defaults;
+        it avoids copying every nested dict and list.
+
+        Returns:
+            Read-only mapping of default configuration values
+        """
+        return _DEFAULT_TEMPLATE
+
+    def validate(self, config: Dict[str, Any], merge_defaults: bool = False) -> Dict[str, Any]:
         """
         Validate and sanitize configuration values.
 
+        Walks the default schema once. With merge_defaults, each section is
+        filled from the defaults and validated in the same pass, so loading
+        a config doesn't need a separate merge loop.
+
         Args:
-            config: Configuration dictionary to validate
+            config: Configuration dictionary to validate (modified in place)
+            merge_defaults: Also fill in keys missing from the defaults
 
         Returns:
             Validated configuration with invalid values replaced by defaults
         """
-        default_config = self.get_default_config()
         warnings = []
 
-        # Validate display_mode
-        if config.get("display_mode") not in constants.VALID_DISPLAY_MODES:
-            warnings.append(
-                f"Invalid display_mode '{config.get('display_mode')}', "
-                f"using default '{constants.DEFAULT_DISPLAY_MODE}'"
-            )
-            config["display_mode"] = default_config["display_mode"]
-
-        # Validate progress_bar_width
-        if "progress_bar_width" in config:
-            width = config["progress_bar_width"]
-            if not isinstance(width, int) or width < constants.MIN_PROGRESS_BAR_WIDTH or width > constants.MAX_PROGRESS_BAR_WIDTH:
-                warnings.append(
-                    f"Invalid progress_bar_width {width}, must be between "
-                    f"{constants.MIN_PROGRESS_BAR_WIDTH} and {constants.MAX_PROGRESS_BAR_WIDTH}. "
-                    f"Using default {default_config['progress_bar_width']}"
-                )
-                config["progress_bar_width"] = default_config["progress_bar_width"]
-
-        # Validate colors
-        if "colors" in config:
-            for field, color in config["colors"].items():
-                if color not in constants.VALID_COLORS:
-                    warnings.append(f"Invalid color '{color}' for field '{field}', using default")
-                    config["colors"][field] = default_config["colors"].get(field, constants.COLOR_WHITE)
-
-        # Validate field_order
-        if "field_order" in config:
-            invalid_fields = [f for f in config["field_order"] if f not in constants.VALID_FIELD_NAMES]
-            if invalid_fields:
-                warnings.append(f"Invalid field names in field_order: {', '.join(invalid_fields)}")
-                config["field_order"] = [f for f in config["field_order"] if f in constants.VALID_FIELD_NAMES]
-
-            # Add any missing valid fields
-            for field in constants.VALID_FIELD_NAMES:
-                if field not in config["field_order"]:
-                    config["field_order"].append(field)
+        for key, default in _DEFAULT_TEMPLATE.items():
+            if merge_defaults:
+                _merge_section(config, key, default)
+            validator = _SECTION_VALIDATORS.get(key)
+            if validator is not None:
+                validator(config, warnings)
 
         # Log warnings if any
         if warnings:
+            logger = _get_logger()
             logger.warning("Configuration validation warnings:")
             for warning in warnings:
                 logger.warning(f"  - {warning}")
@@ -125,46 +214,183 @@ class ConfigManager:
 
     def ensure_exists(self) -> None:
         """Create default config if missing."""
+        # An existing file implies an existing directory: one stat on the hot path
+        if os.path.exists(self._config_file_str):
+            return
+
         self.config_dir.mkdir(parents=True, exist_ok=True)
+        self.save(self.get_default_config())
+
+    def _stat_stamp(self) -> Optional[Tuple[int, int]]:
+        """
+        Return the (mtime_ns, size) stamp of the config file.
+
+        Returns:
+            Stamp tuple, or None if the file cannot be stat'ed
+        """
+        try:
+            st = os.stat(self._config_file_str)
+        except OSError:
+            return None
+        return (st.st_mtime_ns, st.st_size)
+
+    def _write_atomic(self, path: str, data: bytes) -> None:
+        """
+        Write a file atomically via a temp file and os.replace.
 
-        if not self.config_file.exists():
-            self.save(self.get_default_config())
+        A crash mid-write leaves the previous file intact instead of a
+        truncated one. Symlinks are followed so the link target is replaced
+        rather than the link, and an existing file keeps its permissions.
+
+        Args:
+            path: Destination path (inside config_dir)
+            data: File contents
+        """
+        # Replace the symlink target (e.g. dotfiles-managed config), not the link
+        real_path = os.path.realpath(path)
+        try:
+            mode = stat.S_IMODE(os.stat(real_path).st_mode)
+        except FileNotFoundError:
+            mode = None
+
+        # Per-process temp name: overlapping statusline runs must not share it
+        tmp_path = f"{real_path}.{os.getpid()}.tmp"
+        try:
+            f = open(tmp_path, 'wb')
+        except FileNotFoundError:
+            # Only create the directory when it is actually missing
+            os.makedirs(os.path.dirname(real_path), exist_ok=True)
+            f = open(tmp_path, 'wb')
+        try:
+            with f:
+                f.write(data)
+            if mode is not None:
+                # Keep the existing file's permissions
+                os.chmod(tmp_path, mode)
+            os.replace(tmp_path, real_path)
+        except BaseException:
+            try:
+                os.unlink(tmp_path)
+            except OSError:
+                pass
+            raise
+
+    def _read_config_bytes(self) -> Optional[bytes]:
+        """
+        Return the raw contents of the config file.
+
+        Returns:
+            File contents, or None if the file cannot be read
+        """
+        try:
+            with open(self._config_file_str, 'rb') as f:
+                return f.read()
+        except OSError:
+            return None
+
+    def _read_cache(self) -> Optional[_CacheEntry]:
+        """
+        Return the last cached entry for this config file.
+
+        Checks the in-process cache first, then the sidecar pickle file.
+
+        Returns:
+            (stamp, digest, config) entry, or None if nothing usable is cached
+        """
+        key = self._config_file_str
+        entry = _load_cache.get(key)
+        if entry is not None:
+            return entry
+
+        try:
+            with open(self._cache_file_str, 'rb') as f:
+                version, stamp, digest, config = pickle.load(f)
+        except Exception:
+            # Missing, truncated or foreign cache file - treat as a miss
+            return None
+
+        if version != _CACHE_VERSION:
+            return None
+
+        entry = (stamp, digest, _intern_keys(config))
+        _load_cache[key] = entry
+        return entry
+
+    def _write_cache(
+        self,
+        stamp: Optional[Tuple[int, int]],
+        digest: str,
+        config: Dict[str, Any]
+    ) -> None:
+        """
+        Store a validated config in the in-process and sidecar caches.
+
+        Args:
+            stamp: (mtime_ns, size) of the config file the data came from
+            digest: Content digest of the config file
+            config: Validated configuration dictionary
+        """
+        config = copy.deepcopy(config)
+        _load_cache[self._config_file_str] = (stamp, digest, config)
+
+        try:
+            self._write_atomic(
+                self._cache_file_str,
+                pickle.dumps((_CACHE_VERSION, stamp, digest, config), protocol=pickle.HIGHEST_PROTOCOL)
+            )
+        except OSError as e:
+            # Caching is best-effort; the JSON file stays the source of truth
+            _get_logger().debug(f"Could not write config cache: {e}")
 
     def _load_from_file(self) -> Dict[str, Any]:
         """
         Load configuration from file.
 
+        Validated configs are cached in-process and in a sidecar pickle. A
+        matching (mtime_ns, size) stamp skips reading the file entirely; a
+        matching content digest (file touched but not edited) skips parsing,
+        default-merging and validation.
+
         Returns:
             Configuration dictionary
 
         Note:
             Returns default config if file doesn't exist or is invalid.
         """
-        self.ensure_exists()
+        # Stat first: one syscall covers both existence check and cache stamp
+        stamp = self._stat_stamp()
+        if stamp is None:
+            self.ensure_exists()
+            stamp = self._stat_stamp()
+
+        entry = self._read_cache()
+        if entry is not None and stamp is not None and entry[0] == stamp:
+            return copy.deepcopy(entry[2])
 
         try:
-            with open(self.config_file, 'r') as f:
-                config = json.load(f)
-
-            # Merge with defaults to handle missing keys
-            default_config = self.get_default_config()
-            for key, value in default_config.items():
-                if key not in config:
-                    config[key] = value
-                elif isinstance(value, dict):
-                    for subkey, subvalue in value.items():
-                        if subkey not in config[key]:
-                            config[key][subkey] = subvalue
-
-            # Validate the loaded config
-            config = self.validate(config)
+            with open(self._config_file_str, 'rb') as f:
+                raw = f.read()
+
+            digest = _content_digest(raw)
+            if entry is not None and entry[1] == digest:
+                # Contents already validated; just refresh the stamp
+                self._write_cache(stamp, digest, entry[2])
+                return copy.deepcopy(entry[2])
+
+            config = json_utils.loads(raw)
+
+            # Merge with defaults to handle missing keys, validating as we go
+            config = _intern_keys(self.validate(config, merge_defaults=True))
 
+            self._write_cache(stamp, digest, config)
             return config
-        except json.JSONDecodeError as e:
+        except json_utils.JSONDecodeError as e:
+            logger = _get_logger()
             logger.warning(f"Config file contains invalid JSON: {e}")
             logger.warning("Using default configuration instead")
             return self.get_default_config()
         except IOError as e:
+            logger = _get_logger()
             logger.warning(f"Could not read config file: {e}")
             logger.warning("Using default configuration instead")
             return self.get_default_config()
@@ -190,17 +416,26 @@ class ConfigManager:
         Args:
             config: Configuration dictionary to save
         """
-        self.config_dir.mkdir(parents=True, exist_ok=True)
-
         # Validate before saving
         validated_config = self.validate(config.copy())
 
-        with open(self.config_file, 'w') as f:
-            json.dump(validated_config, f, indent=2)
-
-        # Update cache
+        data = json_utils.dumps(validated_config)
+        digest = _content_digest(data)
         self._config = validated_config
 
+        if self._read_config_bytes() == data:
+            # Identical to what's on disk: skip the write, and the cache
+            # refresh too if it already reflects these contents
+            entry = self._read_cache()
+            if entry is not None and entry[1] == digest:
+                return
+        else:
+            self._write_atomic(self._config_file_str, data)
+
+        # Update caches with what a subsequent load of this file would return
+        loaded = self.validate(copy.deepcopy(validated_config), merge_defaults=True)
+        self._write_cache(self._stat_stamp(), digest, loaded)
+
     def reload(self) -> Dict[str, Any]:
         """
         Force reload configuration from file.
@@ -211,6 +446,144 @@ class ConfigManager:
         return self.load(force_reload=True)
 
 
+def _merge_section(config: Dict[str, Any], key: str, default: Any) -> None:
+    """
+    Fill one top-level config section from its default.
+
+    Missing sections get a mutable copy of the default; dict sections get
+    any missing subkeys via a single C-level dict merge.
+
+    Args:
+        config: Configuration dictionary (modified in place)
+        key: Top-level config key
+        default: Read-only default value from _DEFAULT_TEMPLATE
+    """
+    if key not in config:
+        if isinstance(default, Mapping):
+            default = dict(default)
+        elif isinstance(default, tuple):
+            default = list(default)
+        config[key] = default
+    elif isinstance(default, Mapping):
+        section = config[key]
+        if isinstance(section, dict) and not default.keys() <= section.keys():
+            # User values win over defaults ({**a, **b} rather than a | b for Python 3.6)
+            config[key] = {**default, **section}
+
+
+def _validate_display_mode(config: Dict[str, Any], warnings: List[str]) -> None:
+    """Reset an unknown or missing display_mode to the default."""
+    display_mode = config.get("display_mode")
+    if not isinstance(display_mode, str) or display_mode not in constants.VALID_DISPLAY_MODES_SET:
+        warnings.append(
+            f"Invalid display_mode '{display_mode}', "
+            f"using default '{constants.DEFAULT_DISPLAY_MODE}'"
+        )
+        config["display_mode"] = _DEFAULT_TEMPLATE["display_mode"]
+
+
+def _validate_progress_bar_width(config: Dict[str, Any], warnings: List[str]) -> None:
+    """Reset an out-of-range or non-integer progress_bar_width to the default."""
+    if "progress_bar_width" not in config:
+        return
+    width = config["progress_bar_width"]
+    if not isinstance(width, int) or width < constants.MIN_PROGRESS_BAR_WIDTH or width > constants.MAX_PROGRESS_BAR_WIDTH:
+        warnings.append(
+            f"Invalid progress_bar_width {width}, must be between "
+            f"{constants.MIN_PROGRESS_BAR_WIDTH} and {constants.MAX_PROGRESS_BAR_WIDTH}. "
+            f"Using default {_DEFAULT_TEMPLATE['progress_bar_width']}"
+        )
+        config["progress_bar_width"] = _DEFAULT_TEMPLATE["progress_bar_width"]
+
+
+def _validate_colors(config: Dict[str, Any], warnings: List[str]) -> None:
+    """Reset unknown color names to the field's default color."""
+    if "colors" not in config:
+        return
+    default_colors = _DEFAULT_TEMPLATE["colors"]
+    for field, color in config["colors"].items():
+        if not isinstance(color, str) or color not in constants.VALID_COLORS_SET:
+            warnings.append(f"Invalid color '{color}' for field '{field}', using default")
+            config["colors"][field] = default_colors.get(field, constants.COLOR_WHITE)
+
+
+def _validate_field_order(config: Dict[str, Any], warnings: List[str]) -> None:
+    """Drop unknown fields from field_order and append any missing ones."""
+    if "field_order" not in config:
+        return
+    invalid_fields = [f for f in config["field_order"] if f not in constants.VALID_FIELD_NAMES_SET]
+    if invalid_fields:
+        warnings.append(f"Invalid field names in field_order: {', '.join(invalid_fields)}")
+        config["field_order"] = [f for f in config["field_order"] if f in constants.VALID_FIELD_NAMES_SET]
+
+    # Add any missing valid fields
+    present = set(config["field_order"])
+    for field in constants.VALID_FIELD_NAMES:
+        if field not in present:
+            config["field_order"].append(field)
+
+
+# Per-section validators applied by ConfigManager.validate
+_SECTION_VALIDATORS = {
+    "display_mode": _validate_display_mode,
+    "progress_bar_width": _validate_progress_bar_width,
+    "colors": _validate_colors,
+    "field_order": _validate_field_order,
+}
+
+
+def _freeze_defaults(defaults: Dict[str, Any]) -> Mapping[str, Any]:
+    """
+    Build a read-only view of the default config.
+
+    Nested dicts become read-only mappings and lists become tuples.
+
+    Args:
+        defaults: Default configuration dictionary
+
+    Returns:
+        Read-only mapping of default configuration values
+    """
+    frozen = {}
+    for key, value in defaults.items():
+        if isinstance(value, dict):
+            value = types.MappingProxyType(dict(value))
+        elif isinstance(value, list):
+            value = tuple(value)
+        frozen[key] = value
+    return types.MappingProxyType(frozen)
+
+
+# Static default schema, built once per process
+_DEFAULT_TEMPLATE = _freeze_defaults(ConfigManager.get_default_config())
+
+
+def _schema_digest() -> str:
+    """
+    Return a digest of everything that shapes a validated config.
+
+    Covers the defaults merged into the user's file and the values
+    validation accepts, so a release that changes either invalidates
+    cached configs without a manual CACHE_FORMAT_VERSION bump.
+
+    Returns:
+        Hex digest (BLAKE2b, 64-bit)
+    """
+    schema = (
+        ConfigManager.get_default_config(),
+        sorted(constants.VALID_DISPLAY_MODES_SET),
+        sorted(constants.VALID_COLORS_SET),
+        sorted(constants.VALID_FIELD_NAMES_SET),
+        constants.MIN_PROGRESS_BAR_WIDTH,
+        constants.MAX_PROGRESS_BAR_WIDTH,
+    )
+    return _content_digest(repr(schema).encode("utf-8"))
+
+
+# Version tag stored in the sidecar cache: layout version plus schema digest
+_CACHE_VERSION = f"{CACHE_FORMAT_VERSION}:{_schema_digest()}"
+
+
 # ============================================================================
 # Module-level convenience functions (backward compatibility)
 # ============================================================================
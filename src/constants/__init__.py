@@ -49,6 +49,7 @@ from .fields import (
     ICON_KEY_PYTHON,
     ICON_KEY_DATETIME,
     VALID_FIELD_NAMES,
+    VALID_FIELD_NAMES_SET,
     FIELD_LABELS,
     FIELD_ICON_KEYS,
 )
@@ -63,6 +64,7 @@ from .colors import (
     COLOR_RED,
     COLOR_WHITE,
     VALID_COLORS,
+    VALID_COLORS_SET,
     DEFAULT_COLORS,
 )
 
@@ -90,6 +92,7 @@ from .display import (
     DISPLAY_MODE_COMPACT,
     DISPLAY_MODE_VERBOSE,
     VALID_DISPLAY_MODES,
+    VALID_DISPLAY_MODES_SET,
     DEFAULT_DISPLAY_MODE,
     LINE_IDENTITY,
     LINE_STATUS,
@@ -101,10 +104,14 @@ from .display import (
     MINUTES_PER_HOUR,
     MILLISECONDS_PER_MINUTE,
     MILLISECONDS_PER_HOUR,
+    DATETIME_FORMAT,
     GIT_COMMAND_TIMEOUT_SECONDS,
     GH_COMMAND_TIMEOUT_SECONDS,
     GIT_HEAD_REF_PREFIX,
     GIT_DETACHED_HEAD_HASH_LENGTH,
+    GIT_CACHE_TTL_SECONDS,
+    GIT_CACHE_MAX_ENTRIES,
+    SYSTEM_CACHE_TTL_SECONDS,
 )
 
 # Define __all__ for explicit exports
@@ -143,6 +150,7 @@ __all__ = [
     "ICON_KEY_PYTHON",
     "ICON_KEY_DATETIME",
     "VALID_FIELD_NAMES",
+    "VALID_FIELD_NAMES_SET",
     "FIELD_LABELS",
     "FIELD_ICON_KEYS",
     # Colors
@@ -154,6 +162,7 @@ __all__ = [
     "COLOR_RED",
     "COLOR_WHITE",
     "VALID_COLORS",
+    "VALID_COLORS_SET",
     "DEFAULT_COLORS",
     # Config
     "CONFIG_KEY_DISPLAY_MODE",
@@ -175,6 +184,7 @@ __all__ = [
     "DISPLAY_MODE_COMPACT",
     "DISPLAY_MODE_VERBOSE",
     "VALID_DISPLAY_MODES",
+    "VALID_DISPLAY_MODES_SET",
     "DEFAULT_DISPLAY_MODE",
     "LINE_IDENTITY",
     "LINE_STATUS",
@@ -186,8 +196,12 @@ __all__ = [
     "MINUTES_PER_HOUR",
     "MILLISECONDS_PER_MINUTE",
     "MILLISECONDS_PER_HOUR",
+    "DATETIME_FORMAT",
     "GIT_COMMAND_TIMEOUT_SECONDS",
     "GH_COMMAND_TIMEOUT_SECONDS",
     "GIT_HEAD_REF_PREFIX",
     "GIT_DETACHED_HEAD_HASH_LENGTH",
+    "GIT_CACHE_TTL_SECONDS",
+    "GIT_CACHE_MAX_ENTRIES",
+    "SYSTEM_CACHE_TTL_SECONDS",
 ]
@@ -5,7 +5,8 @@ Contains color definitions, valid colors list, and default color
 assignments for fields.
 """
 
-from typing import Dict, List
+from types import MappingProxyType
+from typing import FrozenSet, List, Mapping
 
 # Import field names for default colors mapping
 from .fields import (
@@ -48,11 +49,14 @@ VALID_COLORS: List[str] = [
     COLOR_WHITE,
 ]
 
+# Set form for O(1) membership checks (VALID_COLORS keeps display order)
+VALID_COLORS_SET: FrozenSet[str] = frozenset(VALID_COLORS)
+
 # ============================================================================
 # Default Colors
 # ============================================================================
 
-DEFAULT_COLORS: Dict[str, str] = {
+DEFAULT_COLORS: Mapping[str, str] = MappingProxyType({
     FIELD_CURRENT_DIR: COLOR_CYAN,
     FIELD_GIT_BRANCH: COLOR_GREEN,
     FIELD_MODEL: COLOR_BLUE,
@@ -71,4 +75,4 @@ DEFAULT_COLORS: Dict[str, str] = {
     "progress_bar_filled": COLOR_GREEN,
     "progress_bar_empty": COLOR_WHITE,
     "separator": COLOR_WHITE,
-}
+})
@@ -4,7 +4,8 @@ Configuration-related constants for the Claude Code Statusline Tool.
 Contains configuration keys, validation bounds, and default configuration values.
 """
 
-from typing import Dict, List
+from types import MappingProxyType
+from typing import List, Mapping
 
 # Import field names for default configuration
 from .fields import (
@@ -53,7 +54,7 @@ DEFAULT_PROGRESS_BAR_WIDTH = 10
 DEFAULT_SHOW_PROGRESS_BARS = True
 DEFAULT_ENABLE_COLORS = True
 
-DEFAULT_VISIBLE_FIELDS: Dict[str, bool] = {
+DEFAULT_VISIBLE_FIELDS: Mapping[str, bool] = MappingProxyType({
     FIELD_MODEL: True,
     FIELD_VERSION: True,
     FIELD_CONTEXT_REMAINING: True,
@@ -69,7 +70,7 @@ DEFAULT_VISIBLE_FIELDS: Dict[str, bool] = {
     FIELD_BATTERY: True,
     FIELD_PYTHON_VERSION: True,
     FIELD_DATETIME: True,
-}
+})
 
 DEFAULT_FIELD_ORDER: List[str] = [
     FIELD_CURRENT_DIR,
@@ -2,10 +2,11 @@
 Display-related constants for the Claude Code Statusline Tool.
 
 Contains display modes, line grouping, icons, time formatting,
-and git settings.
+git settings, and system monitoring settings.
 """
 
-from typing import Dict
+from types import MappingProxyType
+from typing import FrozenSet, Mapping
 
 # Import field names for line assignment
 from .fields import (
@@ -38,6 +39,9 @@ VALID_DISPLAY_MODES = [
     DISPLAY_MODE_VERBOSE,
 ]
 
+# Set form for O(1) membership checks
+VALID_DISPLAY_MODES_SET: FrozenSet[str] = frozenset(VALID_DISPLAY_MODES)
+
 DEFAULT_DISPLAY_MODE = DISPLAY_MODE_COMPACT
 
 # ============================================================================
@@ -49,7 +53,7 @@ LINE_STATUS = 2    # Context, duration
 LINE_METRICS = 3   # Cost, tokens, lines changed
 
 # Map fields to their display line
-FIELD_LINE_ASSIGNMENT: Dict[str, int] = {
+FIELD_LINE_ASSIGNMENT: Mapping[str, int] = MappingProxyType({
     FIELD_CURRENT_DIR: LINE_IDENTITY,
     FIELD_GIT_BRANCH: LINE_IDENTITY,
     FIELD_MODEL: LINE_IDENTITY,
@@ -65,13 +69,13 @@ FIELD_LINE_ASSIGNMENT: Dict[str, int] = {
     FIELD_CPU_USAGE: LINE_METRICS,
     FIELD_MEMORY_USAGE: LINE_METRICS,
     FIELD_BATTERY: LINE_METRICS,
-}
+})
 
 # ============================================================================
 # Icons
 # ============================================================================
 
-DEFAULT_ICONS: Dict[str, str] = {
+DEFAULT_ICONS: Mapping[str, str] = MappingProxyType({
     "directory": "📁",
     "git_branch": "🌿",
     "model": "🤖",
@@ -86,7 +90,7 @@ DEFAULT_ICONS: Dict[str, str] = {
     "battery": "🔋",
     "python": "🐍",
     "datetime": "🕐",
-}
+})
 
 # ============================================================================
 # Time Formatting
@@ -97,6 +101,7 @@ SECONDS_PER_MINUTE = 60
 MINUTES_PER_HOUR = 60
 MILLISECONDS_PER_MINUTE = MILLISECONDS_PER_SECOND * SECONDS_PER_MINUTE
 MILLISECONDS_PER_HOUR = MILLISECONDS_PER_MINUTE * MINUTES_PER_HOUR
+DATETIME_FORMAT = "%Y-%m-%d %H:%M:%S"  # Seconds precision for the datetime field
 
 # ============================================================================
 # Git Settings
@@ -106,3 +111,17 @@ GIT_COMMAND_TIMEOUT_SECONDS = 0.5
 GH_COMMAND_TIMEOUT_SECONDS = 2.0  # Longer timeout for gh API calls
 GIT_HEAD_REF_PREFIX = "ref: refs/heads/"
 GIT_DETACHED_HEAD_HASH_LENGTH = 7
+GIT_CACHE_TTL_SECONDS = 5.0  # Reuse git/gh results across statusline runs
+GIT_CACHE_MAX_ENTRIES = 100
+
+# ============================================================================
+# System Monitoring
+# ============================================================================
+
+# How long a sampled metric is reused across statusline runs; slow-moving
+# metrics are sampled less often
+SYSTEM_CACHE_TTL_SECONDS: Mapping[str, float] = MappingProxyType({
+    FIELD_CPU_USAGE: 1.0,
+    FIELD_MEMORY_USAGE: 5.0,
+    FIELD_BATTERY: 30.0,
+})
@@ -5,7 +5,8 @@ Contains field names, labels, icons, and line assignments for
 all displayable fields in the statusline.
 """
 
-from typing import Dict, List
+from types import MappingProxyType
+from typing import FrozenSet, List, Mapping
 
 # ============================================================================
 # Field Names
@@ -71,11 +72,14 @@ VALID_FIELD_NAMES: List[str] = [
     FIELD_DATETIME,
 ]
 
+# Set form for O(1) membership checks (VALID_FIELD_NAMES keeps canonical order)
+VALID_FIELD_NAMES_SET: FrozenSet[str] = frozenset(VALID_FIELD_NAMES)
+
 # ============================================================================
 # Labels (for verbose mode)
 # ============================================================================
 
-FIELD_LABELS: Dict[str, str] = {
+FIELD_LABELS: Mapping[str, str] = MappingProxyType({
     FIELD_CURRENT_DIR: "Directory:",
     FIELD_GIT_BRANCH: "Git branch:",
     FIELD_MODEL: "Model:",
@@ -91,13 +95,13 @@ FIELD_LABELS: Dict[str, str] = {
     FIELD_BATTERY: "Battery:",
     FIELD_PYTHON_VERSION: "Python:",
     FIELD_DATETIME: "Time:",
-}
+})
 
 # ============================================================================
 # Icon Keys (map field names to icon keys)
 # ============================================================================
 
-FIELD_ICON_KEYS: Dict[str, str] = {
+FIELD_ICON_KEYS: Mapping[str, str] = MappingProxyType({
     FIELD_CURRENT_DIR: "directory",
     FIELD_GIT_BRANCH: "git_branch",
     FIELD_MODEL: "model",
@@ -112,4 +116,4 @@ FIELD_ICON_KEYS: Dict[str, str] = {
     FIELD_BATTERY: "battery",
     FIELD_PYTHON_VERSION: "python",
     FIELD_DATETIME: "datetime",
-}
+})
@@ -5,13 +5,132 @@ This module handles extracting and transforming Claude Code JSON data
 into a structured format for display.
 """
 
+import functools
 import os
-from datetime import datetime
-from typing import Dict, Any
+import pickle
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import AbstractSet, Dict, Any, Optional, Tuple
 
-from git_utils import get_git_branch, get_git_status, get_pr_status
-from system_utils import get_cpu_usage, get_memory_usage, get_battery_status
-from python_utils import get_python_version
+import constants
+from colors import is_color_enabled
+from config_manager import CONFIG_DIR
+
+
+# Git branch/status/PR results shared across statusline runs. Each run is a
+# new process, so the cache lives in a sidecar file next to config.json.
+GIT_CACHE_FILE = CONFIG_DIR / "git.cache.pickle"
+GIT_CACHE_FORMAT_VERSION = 1
+
+# Last CPU/memory/battery samples, reused within SYSTEM_CACHE_TTL_SECONDS
+SYSTEM_CACHE_FILE = CONFIG_DIR / "system.cache.pickle"
+SYSTEM_CACHE_FORMAT_VERSION = 1
+
+# Fields filled by _extract_system_info
+SYSTEM_FIELDS = frozenset((
+    constants.FIELD_CPU_USAGE,
+    constants.FIELD_MEMORY_USAGE,
+    constants.FIELD_BATTERY,
+))
+
+# (cwd, colors enabled) -> (cached_at, HEAD mtime_ns, git_branch text)
+_GitCacheKey = Tuple[str, bool]
+_GitCacheEntry = Tuple[float, Optional[int], str]
+_git_cache: Optional[Dict[_GitCacheKey, _GitCacheEntry]] = None
+
+# System field name -> (sampled_at, value)
+_SystemCacheEntry = Tuple[float, str]
+
+
+@functools.lru_cache(maxsize=8)
+def _dir_name(cwd: str) -> str:
+    """
+    Return the display name of a workspace directory (its basename).
+
+    The workspace rarely changes between renders, so results are memoized.
+
+    Args:
+        cwd: Workspace directory
+
+    Returns:
+        Basename of cwd, or cwd itself for paths like "/"
+    """
+    return os.path.basename(cwd) or cwd
+
+
+def _read_sidecar(path: Path, version: int) -> Optional[Dict[Any, Any]]:
+    """
+    Read a versioned cache dictionary pickled next to config.json.
+
+    Args:
+        path: Sidecar file
+        version: Expected format version
+
+    Returns:
+        Cached entries, or None if the file is missing, unusable or stale
+    """
+    try:
+        with open(str(path), 'rb') as f:
+            file_version, entries = pickle.load(f)
+    except Exception:
+        # Missing, truncated or foreign cache file
+        return None
+    if file_version == version and isinstance(entries, dict):
+        return entries
+    return None
+
+
+def _write_sidecar(path: Path, version: int, entries: Dict[Any, Any]) -> None:
+    """
+    Write a versioned cache dictionary atomically, ignoring failures.
+
+    Args:
+        path: Sidecar file
+        version: Format version to record
+        entries: Cache entries to persist
+    """
+    path = str(path)
+    # Per-process temp name: overlapping statusline runs must not share it
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    try:
+        with open(tmp_path, 'wb') as f:
+            pickle.dump((version, entries), f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, path)
+    except OSError:
+        # Caching is best-effort; the next run just samples again
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
+
+
+def _load_git_cache() -> Dict[_GitCacheKey, _GitCacheEntry]:
+    """
+    Return the git cache, reading the sidecar file on first use.
+
+    Returns:
+        Mutable cache dictionary (empty if the file is missing or unusable)
+    """
+    global _git_cache
+    if _git_cache is None:
+        _git_cache = _read_sidecar(GIT_CACHE_FILE, GIT_CACHE_FORMAT_VERSION) or {}
+    return _git_cache
+
+
+def _save_git_cache(cache: Dict[_GitCacheKey, _GitCacheEntry]) -> None:
+    """
+    Write the git cache sidecar atomically, keeping the newest entries.
+
+    Args:
+        cache: Cache dictionary to persist (trimmed in place)
+    """
+    if len(cache) > constants.GIT_CACHE_MAX_ENTRIES:
+        newest = sorted(cache.items(), key=lambda item: item[1][0], reverse=True)
+        cache.clear()
+        cache.update(newest[:constants.GIT_CACHE_MAX_ENTRIES])
+
+    _write_sidecar(GIT_CACHE_FILE, GIT_CACHE_FORMAT_VERSION, cache)
 
 
 class DataExtractor:
@@ -26,27 +145,62 @@ class DataExtractor:
         """
         Extract all relevant fields from Claude Code JSON input.
 
+        Fields that need subprocesses or system sampling (git, CPU, memory,
+        battery, Python version, date/time) are skipped when hidden.
+
         Args:
             json_data: Raw JSON data from Claude Code
-            config: Configuration dictionary (unused currently, for future extensibility)
+            config: Configuration dictionary (its visible_fields decide which
+                of the expensive fields are computed)
 
         Returns:
             Dictionary containing extracted and computed fields
         """
-        data = {}
-        data.update(self._extract_model(json_data))
-        data.update(self._extract_version(json_data))
-        data.update(self._extract_context(json_data))
-        data.update(self._extract_workspace(json_data))
-        # Pass accumulated data for cross-field calculations (e.g., tokens_per_minute)
-        data.update(self._extract_cost(json_data, data))
-        data.update(self._extract_output_style(json_data))
-        # System and environment fields
-        data.update(self._extract_system_info())
-        data.update(self._extract_python_info())
-        data.update(self._extract_datetime())
+        wanted = self._wanted_fields(config)
+        system_fields = wanted & SYSTEM_FIELDS
+
+        # System metrics block on sleeps/subprocesses (CPU sampling) and the
+        # workspace extraction on git, so sample them on a worker meanwhile
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            system_future = None
+            if system_fields:
+                system_future = executor.submit(self._extract_system_info, system_fields)
+
+            data = {}
+            data.update(self._extract_model(json_data))
+            data.update(self._extract_version(json_data))
+            data.update(self._extract_context(json_data))
+            data.update(self._extract_workspace(
+                json_data, include_git=constants.FIELD_GIT_BRANCH in wanted
+            ))
+            # Pass accumulated data for cross-field calculations (e.g., tokens_per_minute)
+            data.update(self._extract_cost(json_data, data))
+            data.update(self._extract_output_style(json_data))
+            # System and environment fields
+            if system_future is not None:
+                data.update(system_future.result())
+        if constants.FIELD_PYTHON_VERSION in wanted:
+            data.update(self._extract_python_info())
+        if constants.FIELD_DATETIME in wanted:
+            data.update(self._extract_datetime())
         return data
 
+    def _wanted_fields(self, config: Dict[str, Any]) -> AbstractSet[str]:
+        """
+        Return the fields worth extracting for this configuration.
+
+        Args:
+            config: Configuration dictionary
+
+        Returns:
+            Names of visible fields, or all field names if the config has no
+            visible_fields section
+        """
+        visible = config.get(constants.CONFIG_KEY_VISIBLE_FIELDS)
+        if visible is None:
+            return constants.VALID_FIELD_NAMES_SET
+        return frozenset(name for name, shown in visible.items() if shown)
+
     def _extract_model(self, json_data: Dict[str, Any]) -> Dict[str, Any]:
         """
         Extract model information.
@@ -60,12 +214,14 @@ class DataExtractor:
             Dictionary with 'model' key if available
         """
         data = {}
-        if "model" in json_data:
-            if "id" in json_data["model"]:
-                data["model"] = json_data["model"]["id"]
-            elif "display_name" in json_data["model"]:
+        model = json_data.get("model")
+        if model:
+            model_id = model.get("id")
+            if model_id is None:
                 # Fallback to display_name if id not available
-                data["model"] = json_data["model"]["display_name"]
+                model_id = model.get("display_name")
+            if model_id is not None:
+                data["model"] = model_id
         return data
 
     def _extract_version(self, json_data: Dict[str, Any]) -> Dict[str, Any]:
@@ -79,8 +235,9 @@ class DataExtractor:
             Dictionary with 'version' key if available
         """
         data = {}
-        if "version" in json_data:
-            data["version"] = json_data["version"]
+        version = json_data.get("version")
+        if version is not None:
+            data["version"] = version
         return data
 
     def _extract_context(self, json_data: Dict[str, Any]) -> Dict[str, Any]:
@@ -97,26 +254,22 @@ class DataExtractor:
             Dictionary with 'context_remaining' and 'tokens' keys if available
         """
         data = {}
-        if "context_window" in json_data:
-            cw = json_data["context_window"]
-
+        cw = json_data.get("context_window")
+        if cw:
             # Context remaining percentage
-            if "remaining_percentage" in cw:
-                data["context_remaining"] = int(cw["remaining_percentage"])
+            remaining = cw.get("remaining_percentage")
+            if remaining is not None:
+                data["context_remaining"] = int(remaining)
 
             # Total tokens (input + output)
-            total_tokens = 0
-            if "total_input_tokens" in cw:
-                total_tokens += cw["total_input_tokens"]
-            if "total_output_tokens" in cw:
-                total_tokens += cw["total_output_tokens"]
+            total_tokens = (cw.get("total_input_tokens") or 0) + (cw.get("total_output_tokens") or 0)
 
             if total_tokens > 0:
                 data["tokens"] = total_tokens
 
         return data
 
-    def _extract_workspace(self, json_data: Dict[str, Any]) -> Dict[str, Any]:
+    def _extract_workspace(self, json_data: Dict[str, Any], include_git: bool = True) -> Dict[str, Any]:
         """
         Extract workspace information.
 
@@ -124,33 +277,91 @@ class DataExtractor:
 
         Args:
             json_data: Raw JSON data
+            include_git: Whether to look up the git branch, status and PR
 
         Returns:
             Dictionary with 'current_dir' and optionally 'git_branch' keys
         """
         data = {}
-        if "workspace" in json_data and "current_dir" in json_data["workspace"]:
-            cwd = json_data["workspace"]["current_dir"]
-            data["current_dir"] = os.path.basename(cwd) or cwd
+        workspace = json_data.get("workspace")
+        cwd = workspace.get("current_dir") if workspace else None
+        if cwd is not None:
+            data["current_dir"] = _dir_name(cwd)
 
-            # Get git branch for the workspace
-            git_branch = get_git_branch(cwd)
-            if git_branch:
-                parts = [git_branch]
+            if include_git:
+                git_branch = self._get_git_info(cwd)
+                if git_branch:
+                    data["git_branch"] = git_branch
 
-                # Add git status if available
-                git_status = get_git_status(cwd)
-                if git_status:
-                    parts.append(git_status)
+        return data
 
-                # Add PR status if available
-                pr_status = get_pr_status(cwd)
-                if pr_status:
-                    parts.append(pr_status)
+    def _get_git_info(self, cwd: str) -> str:
+        """
+        Get the branch, status and PR text for a workspace, using the git cache.
 
-                data["git_branch"] = " ".join(parts)
+        Results are reused for GIT_CACHE_TTL_SECONDS unless the HEAD file changes
+        (e.g. a branch switch), so most renders spawn no git/gh processes.
 
-        return data
+        Args:
+            cwd: Workspace directory
+
+        Returns:
+            Branch name followed by status and PR indicators, or empty string
+        """
+        # Imported on demand: hidden git fields skip the subprocess import
+        import git_utils
+
+        cache = _load_git_cache()
+        key = (cwd, is_color_enabled())
+        head_mtime = git_utils.get_head_mtime(cwd)
+        now = time.time()
+
+        entry = cache.get(key)
+        if entry is not None:
+            cached_at, cached_mtime, text = entry
+            if cached_mtime == head_mtime and 0 <= now - cached_at < constants.GIT_CACHE_TTL_SECONDS:
+                return text
+
+        text = self._query_git_info(cwd)
+        cache[key] = (now, head_mtime, text)
+        _save_git_cache(cache)
+        return text
+
+    def _query_git_info(self, cwd: str) -> str:
+        """
+        Run the git and gh queries for a workspace.
+
+        Args:
+            cwd: Workspace directory
+
+        Returns:
+            Branch name followed by status and PR indicators, or empty string
+        """
+        # Imported on demand: hidden git fields skip the subprocess import
+        import git_utils
+
+        git_branch = git_utils.get_git_branch(cwd)
+        if not git_branch:
+            return ""
+
+        # The gh API call and the git status calls are independent and spend
+        # their time waiting on subprocesses, so overlap them
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            pr_future = executor.submit(git_utils.get_pr_status, cwd)
+            git_status = git_utils.get_git_status(cwd)
+            pr_status = pr_future.result()
+
+        parts = [git_branch]
+
+        # Add git status if available
+        if git_status:
+            parts.append(git_status)
+
+        # Add PR status if available
+        if pr_status:
+            parts.append(pr_status)
+
+        return " ".join(parts)
 
     def _extract_cost(self, json_data: Dict[str, Any], accumulated_data: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -171,28 +382,28 @@ class DataExtractor:
             Dictionary with cost-related fields if available
         """
         data = {}
-        if "cost" in json_data:
-            cost_data = json_data["cost"]
-
+        cost_data = json_data.get("cost")
+        if cost_data:
             # Total cost
-            if "total_cost_usd" in cost_data:
-                data["cost"] = cost_data["total_cost_usd"]
+            cost = cost_data.get("total_cost_usd")
+            if cost is not None:
+                data["cost"] = cost
 
             # Duration and calculated rates
-            if "total_duration_ms" in cost_data:
-                duration_ms = cost_data["total_duration_ms"]
+            duration_ms = cost_data.get("total_duration_ms")
+            if duration_ms is not None:
                 data["duration"] = duration_ms
 
-                # Calculate cost per hour
-                if data.get("cost") and duration_ms > 0:
-                    duration_hours = duration_ms / (1000 * 60 * 60)
-                    data["cost_per_hour"] = data["cost"] / duration_hours if duration_hours > 0 else 0
+                if duration_ms > 0:
+                    # Calculate cost per hour
+                    if cost:
+                        data["cost_per_hour"] = cost / (duration_ms / constants.MILLISECONDS_PER_HOUR)
 
-                # Calculate tokens per minute
-                # Use tokens from accumulated_data (extracted in _extract_context)
-                if accumulated_data.get("tokens") and duration_ms > 0:
-                    duration_minutes = duration_ms / (1000 * 60)
-                    data["tokens_per_minute"] = int(accumulated_data["tokens"] / duration_minutes) if duration_minutes > 0 else 0
+                    # Calculate tokens per minute
+                    # Use tokens from accumulated_data (extracted in _extract_context)
+                    tokens = accumulated_data.get("tokens")
+                    if tokens:
+                        data["tokens_per_minute"] = int(tokens / (duration_ms / constants.MILLISECONDS_PER_MINUTE))
 
             # Lines changed (added + removed)
             lines_added = cost_data.get("total_lines_added", 0)
@@ -213,32 +424,56 @@ class DataExtractor:
             Dictionary with 'output_style' key if available
         """
         data = {}
-        if "output_style" in json_data and "name" in json_data["output_style"]:
-            data["output_style"] = json_data["output_style"]["name"]
+        output_style = json_data.get("output_style")
+        name = output_style.get("name") if output_style else None
+        if name is not None:
+            data["output_style"] = name
         return data
 
-    def _extract_system_info(self) -> Dict[str, Any]:
+    def _extract_system_info(self, fields: AbstractSet[str] = SYSTEM_FIELDS) -> Dict[str, Any]:
         """
         Extract system monitoring information.
 
         Includes CPU usage, memory usage, and battery status.
 
+        Args:
+            fields: Which of cpu_usage, memory_usage and battery to sample
+
         Returns:
             Dictionary with system info fields if available
         """
         data = {}
-
-        cpu = get_cpu_usage()
-        if cpu:
-            data["cpu_usage"] = cpu
-
-        memory = get_memory_usage()
-        if memory:
-            data["memory_usage"] = memory
-
-        battery = get_battery_status()
-        if battery:
-            data["battery"] = battery
+        cache: Dict[str, _SystemCacheEntry] = _read_sidecar(
+            SYSTEM_CACHE_FILE, SYSTEM_CACHE_FORMAT_VERSION
+        ) or {}
+        now = time.time()
+        sampled = []
+
+        def sample(field: str, sampler: str) -> None:
+            # Reuse a recent sample (CPU sampling alone sleeps ~100ms)
+            entry = cache.get(field)
+            if entry is not None and 0 <= now - entry[0] < constants.SYSTEM_CACHE_TTL_SECONDS[field]:
+                value = entry[1]
+            else:
+                # Imported on demand: renders served from the cache skip it
+                import system_utils
+                value = getattr(system_utils, sampler)()
+                cache[field] = (now, value)
+                sampled.append(field)
+            if value:
+                data[field] = value
+
+        if constants.FIELD_CPU_USAGE in fields:
+            sample(constants.FIELD_CPU_USAGE, "get_cpu_usage")
+
+        if constants.FIELD_MEMORY_USAGE in fields:
+            sample(constants.FIELD_MEMORY_USAGE, "get_memory_usage")
+
+        if constants.FIELD_BATTERY in fields:
+            sample(constants.FIELD_BATTERY, "get_battery_status")
+
+        if sampled:
+            _write_sidecar(SYSTEM_CACHE_FILE, SYSTEM_CACHE_FORMAT_VERSION, cache)
 
         return data
 
@@ -251,6 +486,8 @@ class DataExtractor:
         Returns:
             Dictionary with Python info fields if available
         """
+        from python_utils import get_python_version
+
         data = {}
 
         python_version = get_python_version()
@@ -267,9 +504,8 @@ class DataExtractor:
             Dictionary with 'datetime' key
         """
         data = {}
-        now = datetime.now()
-        # Format with seconds precision: YYYY-MM-DD HH:MM:SS
-        data["datetime"] = now.strftime("%Y-%m-%d %H:%M:%S")
+        # Format local time with seconds precision: YYYY-MM-DD HH:MM:SS
+        data["datetime"] = time.strftime(constants.DATETIME_FORMAT)
         return data
 
 
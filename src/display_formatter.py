@@ -6,13 +6,37 @@ Each field knows how to format itself, eliminating code duplication and
 improving maintainability.
 """
 
-from typing import Dict, Any, List
-from colors import colorize
+import functools
+from typing import Dict, Any, List, Tuple
+from colors import colorize, is_color_enabled
 import constants
-from fields import create_field_registry, Field
-from models import StatusLineData, Configuration
+from fields import create_field_registry, progress_bar_fill, render_progress_bar, Field
+from fields import format_duration as _format_duration
 from exceptions import FieldNotFoundError
 
+# Field instances are never mutated after construction, so one registry is
+# built at import and shared by every formatter.
+_FIELD_REGISTRY: Dict[str, Field] = create_field_registry()
+
+# Output bucket for each line assignment; anything else lands on the metrics line
+_LINE_BUCKETS: Dict[int, int] = {
+    constants.LINE_IDENTITY: 0,
+    constants.LINE_STATUS: 1,
+    constants.LINE_METRICS: 2,
+}
+
+# Field name -> (field, output bucket), resolved once from the registry
+_FIELD_PLAN: Dict[str, Tuple[Field, int]] = {
+    name: (field, _LINE_BUCKETS.get(field.line, 2))
+    for name, field in _FIELD_REGISTRY.items()
+}
+
+
+@functools.lru_cache(maxsize=8)
+def _separator(color: str, colors_enabled: bool) -> str:
+    """Colorized field separator (keyed on color state, which colorize reads)."""
+    return colorize("  ", color)
+
 
 class StatusLineFormatter:
     """
@@ -23,8 +47,9 @@ class StatusLineFormatter:
     """
 
     def __init__(self):
-        """Initialize formatter with field registry."""
-        self._field_registry: Dict[str, Field] = create_field_registry()
+        """Initialize formatter with the shared field registry."""
+        self._field_registry: Dict[str, Field] = _FIELD_REGISTRY
+        self._field_plan: Dict[str, Tuple[Field, int]] = _FIELD_PLAN
 
     def get_field(self, field_name: str) -> Field:
         """
@@ -60,52 +85,30 @@ class StatusLineFormatter:
         Returns:
             Formatted statusline string
         """
-        # Wrap dictionaries in typed models
-        status_data = StatusLineData(data)
-        configuration = Configuration(config)
-
-        separator = colorize("  ", configuration.get_color("separator"))
-
-        # Group fields by line
-        line1_fields: List[str] = []  # Identity
-        line2_fields: List[str] = []  # Status
-        line3_fields: List[str] = []  # Metrics
-
-        # Process fields in user's configured order
-        for field_name in configuration.field_order:
-            # Skip if field not visible
-            if not configuration.is_field_visible(field_name):
-                continue
-
-            # Skip if field not in registry
-            if field_name not in self._field_registry:
-                continue
-
-            # Get field instance and format it
-            field = self.get_field(field_name)
+        # Read the few settings needed straight from the dict; the typed
+        # Configuration wrapper would only add a method call per lookup
+        colors = config.get(constants.CONFIG_KEY_COLORS, {})
+        separator = _separator(colors.get("separator", constants.COLOR_WHITE), is_color_enabled())
+
+        # Resolve the visible, registered fields in the user's configured
+        # order up front so the loop below only formats and buckets them
+        field_plan = self._field_plan
+        visible = config.get(constants.CONFIG_KEY_VISIBLE_FIELDS, {})
+        plan = [
+            field_plan[field_name]
+            for field_name in config.get(constants.CONFIG_KEY_FIELD_ORDER, [])
+            if visible.get(field_name, False) and field_name in field_plan
+        ]
+
+        # Group fields by line: identity, status, metrics
+        buckets: List[List[str]] = [[], [], []]
+        for field, bucket in plan:
             formatted = field.format(data, config, verbose=verbose)
+            if formatted:
+                buckets[bucket].append(formatted)
 
-            if not formatted:
-                continue
-
-            # Add to appropriate line based on field's line assignment
-            if field.line == constants.LINE_IDENTITY:
-                line1_fields.append(formatted)
-            elif field.line == constants.LINE_STATUS:
-                line2_fields.append(formatted)
-            else:  # LINE_METRICS
-                line3_fields.append(formatted)
-
-        # Build output lines
-        lines = []
-        if line1_fields:
-            lines.append(separator.join(line1_fields))
-        if line2_fields:
-            lines.append(separator.join(line2_fields))
-        if line3_fields:
-            lines.append(separator.join(line3_fields))
-
-        return "\n".join(lines)
+        # A list comprehension, not a generator: join() builds a list anyway
+        return "\n".join([separator.join(fields) for fields in buckets if fields])
 
     def format_compact(self, data: Dict[str, Any], config: Dict[str, Any]) -> str:
         """
@@ -188,7 +191,7 @@ def format_compact(data: Dict[str, Any], config: Dict[str, Any]) -> str:
     Returns:
         Formatted statusline in compact mode
     """
-    return _default_formatter.format_compact(data, config)
+    return _default_formatter.format(data, config, verbose=False)
 
 
 def format_verbose(data: Dict[str, Any], config: Dict[str, Any]) -> str:
@@ -202,7 +205,7 @@ def format_verbose(data: Dict[str, Any], config: Dict[str, Any]) -> str:
     Returns:
         Formatted statusline in verbose mode
     """
-    return _default_formatter.format_verbose(data, config)
+    return _default_formatter.format(data, config, verbose=True)
 
 
 # ============================================================================
@@ -224,19 +227,15 @@ def format_progress_bar(percentage: int, width: int, config: Dict[str, Any]) ->
     if not config.get("show_progress_bars", True):
         return ""
 
-    filled_count = int((percentage / 100) * width)
-    empty_count = width - filled_count
-
-    filled_color = config["colors"].get("progress_bar_filled", constants.COLOR_GREEN)
-    empty_color = config["colors"].get("progress_bar_empty", constants.COLOR_WHITE)
-    separator_color = config["colors"].get("separator", constants.COLOR_WHITE)
-
-    filled = colorize("=" * filled_count, filled_color)
-    empty = colorize("-" * empty_count, empty_color)
-    bracket_open = colorize("[", separator_color)
-    bracket_close = colorize("]", separator_color)
-
-    return f"{bracket_open}{filled}{empty}{bracket_close}"
+    colors = config["colors"]
+    return render_progress_bar(
+        progress_bar_fill(percentage, width),
+        width,
+        colors.get("progress_bar_filled", constants.COLOR_GREEN),
+        colors.get("progress_bar_empty", constants.COLOR_WHITE),
+        colors.get("separator", constants.COLOR_WHITE),
+        is_color_enabled()
+    )
 
 
 def format_field(field_name: str, value: str, config: Dict[str, Any]) -> str:
@@ -285,11 +284,12 @@ def format_field_verbose(
     if not value:
         return ""
 
+    colors = config["colors"]
     icon = config["icons"].get(field_name, "")
-    color = config["colors"].get(field_name, constants.COLOR_WHITE)
+    color = colors.get(field_name, constants.COLOR_WHITE)
 
     # Colorize the label and value
-    label_colored = colorize(label, config["colors"].get("separator", constants.COLOR_WHITE))
+    label_colored = colorize(label, colors.get("separator", constants.COLOR_WHITE))
     value_colored = colorize(str(value), color)
 
     # Combine icon, label, and value
@@ -308,18 +308,4 @@ def format_duration(duration_ms: int) -> str:
     Returns:
         Human-readable duration string
     """
-    if duration_ms < constants.MILLISECONDS_PER_SECOND:
-        return f"{duration_ms}ms"
-
-    seconds = duration_ms / constants.MILLISECONDS_PER_SECOND
-    if seconds < constants.SECONDS_PER_MINUTE:
-        return f"{seconds:.1f}s"
-
-    minutes = int(seconds / constants.SECONDS_PER_MINUTE)
-    hours = int(minutes / constants.MINUTES_PER_HOUR)
-
-    if hours > 0:
-        remaining_minutes = minutes % constants.MINUTES_PER_HOUR
-        return f"{hours}h {remaining_minutes}m"
-
-    return f"{minutes}m"
+    return _format_duration(duration_ms)
@@ -5,13 +5,94 @@ This module provides an object-oriented approach to field formatting,
 where each field knows how to format itself based on display mode.
 """
 
+import functools
 from typing import Dict, Any, Optional
 from abc import ABC, abstractmethod
 
-from colors import colorize
+from colors import colorize, is_color_enabled
 import constants
 
 
+def progress_bar_fill(percentage: int, width: int) -> int:
+    """
+    Return how many cells of a progress bar a percentage fills.
+
+    Args:
+        percentage: Progress percentage (0-100)
+        width: Width of progress bar
+
+    Returns:
+        Number of filled cells
+    """
+    return int((percentage / 100) * width)
+
+
+@functools.lru_cache(maxsize=256)
+def render_progress_bar(
+    filled_count: int,
+    width: int,
+    filled_color: str,
+    empty_color: str,
+    separator_color: str,
+    colors_enabled: bool
+) -> str:
+    """
+    Compose a colored progress bar.
+
+    A bar of a given width has only width + 1 fill levels, so finished bars
+    are cached by fill level rather than by percentage. colors_enabled is
+    part of the key because colorize() reads it.
+
+    Args:
+        filled_count: Number of filled cells (see progress_bar_fill)
+        width: Width of progress bar
+        filled_color: Color of the filled part
+        empty_color: Color of the empty part
+        separator_color: Color of the brackets
+        colors_enabled: Current color state
+
+    Returns:
+        Formatted progress bar string
+    """
+    empty_count = width - filled_count
+
+    filled = colorize("=" * filled_count, filled_color)
+    empty = colorize("-" * empty_count, empty_color)
+    bracket_open = colorize("[", separator_color)
+    bracket_close = colorize("]", separator_color)
+
+    return f"{bracket_open}{filled}{empty}{bracket_close}"
+
+
+def format_duration(duration_ms: int) -> str:
+    """
+    Convert milliseconds to readable format.
+
+    Compares against the precomputed millisecond thresholds and splits
+    hours and minutes with one divmod instead of deriving each unit in turn.
+
+    Args:
+        duration_ms: Duration in milliseconds
+
+    Returns:
+        Human-readable duration string
+    """
+    if duration_ms < constants.MILLISECONDS_PER_SECOND:
+        return f"{duration_ms}ms"
+
+    if duration_ms < constants.MILLISECONDS_PER_MINUTE:
+        return f"{duration_ms / constants.MILLISECONDS_PER_SECOND:.1f}s"
+
+    hours, minutes = divmod(
+        int(duration_ms / constants.MILLISECONDS_PER_MINUTE),
+        constants.MINUTES_PER_HOUR
+    )
+    if hours:
+        return f"{hours}h {minutes}m"
+
+    return f"{minutes}m"
+
+
 class Field(ABC):
     """
     Base class for all statusline fields.
@@ -81,9 +162,10 @@ class Field(ABC):
         if not value:
             return ""
 
+        colors = config["colors"]
         icon = config["icons"].get(self.icon_key, "")
-        color = config["colors"].get(self.color_key, constants.COLOR_WHITE)
-        separator_color = config["colors"].get("separator", constants.COLOR_WHITE)
+        color = colors.get(self.color_key, constants.COLOR_WHITE)
+        separator_color = colors.get("separator", constants.COLOR_WHITE)
 
         label_colored = colorize(self.label, separator_color)
         value_colored = colorize(value, color)
@@ -123,7 +205,8 @@ class SimpleField(Field):
 
     def format_value(self, data: Dict[str, Any], config: Dict[str, Any]) -> str:
         """Return the field value as-is from data."""
-        return str(data.get(self.name, "")) if data.get(self.name) else ""
+        value = data.get(self.name)
+        return str(value) if value else ""
 
 
 class ProgressField(Field):
@@ -133,6 +216,28 @@ class ProgressField(Field):
     Example: context_remaining
     """
 
+    def __init__(
+        self,
+        name: str,
+        icon_key: str,
+        line: int,
+        label: str = "",
+        color_key: Optional[str] = None
+    ):
+        """
+        Initialize a progress field.
+
+        Args:
+            name: Field name
+            icon_key: Icon key
+            line: Line number
+            label: Verbose mode label
+            color_key: Color key
+        """
+        super().__init__(name, icon_key, line, label, color_key)
+        # Compact mode capitalizes the label; derive it once rather than per render
+        self.compact_label = label.replace("Context remaining:", "Context Remaining:")
+
     def format_value(self, data: Dict[str, Any], config: Dict[str, Any]) -> str:
         """Format percentage value."""
         percentage = data.get(self.name)
@@ -150,19 +255,15 @@ class ProgressField(Field):
         if not config.get("show_progress_bars", True):
             return ""
 
-        filled_count = int((percentage / 100) * width)
-        empty_count = width - filled_count
-
-        filled_color = config["colors"].get("progress_bar_filled", constants.COLOR_GREEN)
-        empty_color = config["colors"].get("progress_bar_empty", constants.COLOR_WHITE)
-        separator_color = config["colors"].get("separator", constants.COLOR_WHITE)
-
-        filled = colorize("=" * filled_count, filled_color)
-        empty = colorize("-" * empty_count, empty_color)
-        bracket_open = colorize("[", separator_color)
-        bracket_close = colorize("]", separator_color)
-
-        return f"{bracket_open}{filled}{empty}{bracket_close}"
+        colors = config["colors"]
+        return render_progress_bar(
+            progress_bar_fill(percentage, width),
+            width,
+            colors.get("progress_bar_filled", constants.COLOR_GREEN),
+            colors.get("progress_bar_empty", constants.COLOR_WHITE),
+            colors.get("separator", constants.COLOR_WHITE),
+            is_color_enabled()
+        )
 
     def format_compact(self, data: Dict[str, Any], config: Dict[str, Any]) -> str:
         """Format with progress bar in compact mode."""
@@ -173,9 +274,7 @@ class ProgressField(Field):
         icon = config["icons"].get(self.icon_key, "")
         color = config["colors"].get(self.color_key, constants.COLOR_YELLOW)
 
-        # Use label from constants, capitalize first letter of second word for display
-        label_text = self.label.replace("Context remaining:", "Context Remaining:")
-        context_text = f"{label_text} {percentage}%"
+        context_text = f"{self.compact_label} {percentage}%"
         context_colored = colorize(context_text, color)
         progress_bar = self._format_progress_bar(
             percentage,
@@ -206,7 +305,8 @@ class MetricField(Field):
     """
     A field that displays a metric with optional rate information.
 
-    Examples: tokens (with tpm), cost (with cost per hour)
+    Subclasses format specific metrics (cost, tokens, lines changed); the
+    base class renders the value as-is plus rate_format when given.
     """
 
     def __init__(
@@ -241,28 +341,70 @@ class MetricField(Field):
         if value is None:
             return ""
 
-        # Format main value
-        if self.name == constants.FIELD_COST:
-            formatted = f"${value:.2f}"
-        elif self.name == constants.FIELD_TOKENS:
-            formatted = f"{value} tok"
-        elif self.name == constants.FIELD_LINES_CHANGED:
-            formatted = f"{value} lines"
-        else:
-            formatted = str(value)
+        formatted = str(value)
 
         # Add rate if available
-        if self.rate_field:
+        if self.rate_field and self.rate_format:
             rate_value = data.get(self.rate_field)
             if rate_value is not None:
-                if self.name == constants.FIELD_COST:
-                    formatted += f" (${rate_value:.2f}/h)"
-                elif self.name == constants.FIELD_TOKENS:
-                    formatted += f" ({rate_value} tpm)"
+                formatted += " " + self.rate_format.format(value=rate_value)
 
         return formatted
 
 
+class CostField(MetricField):
+    """
+    Session cost in USD with the hourly rate.
+
+    Example: cost
+    """
+
+    def format_value(self, data: Dict[str, Any], config: Dict[str, Any]) -> str:
+        """Format cost with optional cost per hour."""
+        value = data.get(self.name)
+        if value is None:
+            return ""
+
+        rate_value = data.get(self.rate_field) if self.rate_field else None
+        if rate_value is None:
+            return f"${value:.2f}"
+        return f"${value:.2f} (${rate_value:.2f}/h)"
+
+
+class TokensField(MetricField):
+    """
+    Token count with the per-minute rate.
+
+    Example: tokens
+    """
+
+    def format_value(self, data: Dict[str, Any], config: Dict[str, Any]) -> str:
+        """Format token count with optional tokens per minute."""
+        value = data.get(self.name)
+        if value is None:
+            return ""
+
+        rate_value = data.get(self.rate_field) if self.rate_field else None
+        if rate_value is None:
+            return f"{value} tok"
+        return f"{value} tok ({rate_value} tpm)"
+
+
+class LinesChangedField(MetricField):
+    """
+    Lines added plus removed.
+
+    Example: lines_changed
+    """
+
+    def format_value(self, data: Dict[str, Any], config: Dict[str, Any]) -> str:
+        """Format lines changed count."""
+        value = data.get(self.name)
+        if value is None:
+            return ""
+        return f"{value} lines"
+
+
 class DurationField(Field):
     """
     A field that formats duration in milliseconds to human-readable format.
@@ -276,21 +418,7 @@ class DurationField(Field):
         if duration_ms is None:
             return ""
 
-        if duration_ms < constants.MILLISECONDS_PER_SECOND:
-            return f"{duration_ms}ms"
-
-        seconds = duration_ms / constants.MILLISECONDS_PER_SECOND
-        if seconds < constants.SECONDS_PER_MINUTE:
-            return f"{seconds:.1f}s"
-
-        minutes = int(seconds / constants.SECONDS_PER_MINUTE)
-        hours = int(minutes / constants.MINUTES_PER_HOUR)
-
-        if hours > 0:
-            remaining_minutes = minutes % constants.MINUTES_PER_HOUR
-            return f"{hours}h {remaining_minutes}m"
-
-        return f"{minutes}m"
+        return format_duration(duration_ms)
 
 
 # ============================================================================
@@ -347,21 +475,21 @@ def create_field_registry() -> Dict[str, Field]:
             line=constants.LINE_STATUS,
             label=constants.FIELD_LABELS[constants.FIELD_DURATION]
         ),
-        constants.FIELD_COST: MetricField(
+        constants.FIELD_COST: CostField(
             name=constants.FIELD_COST,
             icon_key=constants.ICON_KEY_COST,
             line=constants.LINE_METRICS,
             label=constants.FIELD_LABELS[constants.FIELD_COST],
             rate_field=constants.FIELD_COST_PER_HOUR
         ),
-        constants.FIELD_TOKENS: MetricField(
+        constants.FIELD_TOKENS: TokensField(
             name=constants.FIELD_TOKENS,
             icon_key=constants.ICON_KEY_TOKENS,
             line=constants.LINE_METRICS,
             label=constants.FIELD_LABELS[constants.FIELD_TOKENS],
             rate_field=constants.FIELD_TOKENS_PER_MINUTE
         ),
-        constants.FIELD_LINES_CHANGED: MetricField(
+        constants.FIELD_LINES_CHANGED: LinesChangedField(
             name=constants.FIELD_LINES_CHANGED,
             icon_key=constants.ICON_KEY_TOKENS,  # Uses tokens icon/color by default
             line=constants.LINE_METRICS,
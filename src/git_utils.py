@@ -1,3 +1,4 @@
+import functools
 import os
 import subprocess
 import json
@@ -8,6 +9,68 @@ import constants
 from colors import colorize
 
 
+@functools.lru_cache(maxsize=4)
+def get_git_dir(cwd: str) -> Optional[Path]:
+    """
+    Locate the git directory of a workspace, following worktree links.
+
+    Like git itself, the search starts at cwd and walks up the parent
+    directories, so subdirectories of a repository resolve too. The
+    workspace is fixed for a statusline run, so the lookup is done once
+    and shared by the branch and status helpers.
+
+    Args:
+        cwd: Current working directory path
+
+    Returns:
+        Path to the git directory, or None if no usable .git entry is found
+
+    Raises:
+        OSError: If a worktree .git file can't be read (not cached)
+    """
+    workspace = Path(os.path.abspath(cwd))
+
+    for directory in (workspace, *workspace.parents):
+        git_dir = directory / ".git"
+
+        if git_dir.is_file():
+            # Handle git worktrees and submodules - .git is a file pointing
+            # to the actual git dir
+            with open(git_dir, 'r') as f:
+                git_dir_line = f.read().strip()
+            if git_dir_line.startswith('gitdir: '):
+                # Relative gitdir paths are relative to the .git file
+                git_dir = directory / git_dir_line[8:]
+            return git_dir if git_dir.is_dir() else None
+
+        if git_dir.is_dir():
+            return git_dir
+
+    return None
+
+
+def get_head_mtime(cwd: str) -> Optional[int]:
+    """
+    Return the mtime of the workspace's HEAD file, which changes on branch switches.
+
+    Uses the same git directory lookup as the branch and status helpers,
+    so subdirectories, worktrees and submodules are covered.
+
+    Args:
+        cwd: Current working directory path
+
+    Returns:
+        mtime in nanoseconds, or None if there is no readable HEAD
+    """
+    try:
+        git_dir = get_git_dir(cwd)
+        if git_dir is None:
+            return None
+        return os.stat(str(git_dir / "HEAD")).st_mtime_ns
+    except OSError:
+        return None
+
+
 def get_git_status(cwd: str) -> str:
     """
     Get git status indicators (dirty/clean, ahead/behind) with colors.
@@ -25,16 +88,23 @@ def get_git_status(cwd: str) -> str:
         Status string with colored indicators (e.g., "★ ↑2", "✓", "★ ↓1 ↑3") or empty string
     """
     try:
-        # Check if we're in a git repository
-        result = subprocess.run(
-            ['git', 'rev-parse', '--git-dir'],
-            cwd=cwd,
-            capture_output=True,
-            text=True,
-            timeout=constants.GIT_COMMAND_TIMEOUT_SECONDS
-        )
-        if result.returncode != 0:
-            return ""
+        git_dir = get_git_dir(cwd)
+    except OSError:
+        git_dir = None
+
+    try:
+        # Check if we're in a git repository (no subprocess needed when
+        # get_git_dir already found a git directory)
+        if git_dir is None:
+            result = subprocess.run(
+                ['git', 'rev-parse', '--git-dir'],
+                cwd=cwd,
+                capture_output=True,
+                text=True,
+                timeout=constants.GIT_COMMAND_TIMEOUT_SECONDS
+            )
+            if result.returncode != 0:
+                return ""
 
         indicators = []
 
@@ -133,16 +203,9 @@ def get_git_branch(cwd: str) -> str:
     """
     try:
         # Method 1: Read .git/HEAD directly (faster)
-        git_dir = Path(cwd) / ".git"
+        git_dir = get_git_dir(cwd)
 
-        if git_dir.is_file():
-            # Handle git worktrees - .git is a file pointing to actual git dir
-            with open(git_dir, 'r') as f:
-                git_dir_line = f.read().strip()
-                if git_dir_line.startswith('gitdir: '):
-                    git_dir = Path(git_dir_line[8:])
-
-        if git_dir.is_dir():
+        if git_dir is not None:
             head_file = git_dir / "HEAD"
             if head_file.exists():
                 with open(head_file, 'r') as f:
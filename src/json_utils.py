@@ -0,0 +1,65 @@
+"""
+JSON utilities for the Claude Code Statusline Tool.
+
+Provides JSON encode/decode helpers that use orjson when it is installed and
+fall back to the standard library otherwise. orjson is optional; the tool
+keeps working with zero external dependencies.
+"""
+
+import json
+from typing import Any, Union
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# orjson.JSONDecodeError subclasses json.JSONDecodeError, so callers can keep
+# catching the stdlib exception regardless of which backend is active.
+JSONDecodeError = json.JSONDecodeError
+
+
+def loads(raw: Union[bytes, str]) -> Any:
+    """
+    Parse JSON from bytes or text.
+
+    Args:
+        raw: UTF-8 encoded JSON document, or the decoded text
+
+    Returns:
+        Parsed JSON value
+
+    Raises:
+        JSONDecodeError: If the data is not valid JSON
+    """
+    try:
+        return _loads(raw)
+    except ValueError:
+        if not isinstance(raw, bytes):
+            raise
+        # Undecodable bytes are replaced rather than rejecting the whole
+        # document, matching what a text-mode read of the same input yields.
+        # Genuinely malformed JSON fails again here with JSONDecodeError.
+        return _loads(raw.decode("utf-8", errors="replace"))
+
+
+def _loads(raw: Union[bytes, str]) -> Any:
+    """Parse JSON with the active backend."""
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
+def dumps(obj: Any) -> bytes:
+    """
+    Serialize a value to UTF-8 JSON with two-space indentation.
+
+    Args:
+        obj: JSON-serializable value
+
+    Returns:
+        Encoded JSON document
+    """
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+    return json.dumps(obj, indent=2, ensure_ascii=False).encode("utf-8")
@@ -5,15 +5,15 @@ from pathlib import Path
 # Add src directory to path for imports (must be before other local imports)
 sys.path.insert(0, str(Path(__file__).parent))
 
-import json
 import logging
 import os
-from typing import Dict, Any
+from typing import Dict, Any, Union
 from config_manager import ConfigManager, load_config
 from display_formatter import StatusLineFormatter, format_compact, format_verbose
 from data_extractor import DataExtractor, extract_data
 from exceptions import InvalidJSONError
 import colors
+import json_utils
 
 # Configure logger
 logger = logging.getLogger("claude_statusline")
@@ -70,14 +70,14 @@ class StatusLine:
         self.data_extractor = DataExtractor()
         self.formatter = StatusLineFormatter()
 
-    def generate(self, json_input: str) -> str:
+    def generate(self, json_input: Union[str, bytes]) -> str:
         """
         Generate statusline from JSON input.
 
         This is the main entry point for programmatic use of the statusline generator.
 
         Args:
-            json_input: JSON string from Claude Code
+            json_input: JSON document from Claude Code (text or UTF-8 bytes)
 
         Returns:
             Formatted statusline string
@@ -89,9 +89,9 @@ class StatusLine:
         # Parse JSON
         logger.debug("Parsing JSON input")
         try:
-            json_data = json.loads(json_input)
+            json_data = json_utils.loads(json_input)
             logger.debug(f"Successfully parsed JSON with keys: {list(json_data.keys())}")
-        except json.JSONDecodeError as e:
+        except json_utils.JSONDecodeError as e:
             raise InvalidJSONError(f"Failed to parse JSON input: {e}")
 
         # Load configuration
@@ -156,9 +156,10 @@ def main() -> None:
     _configure_logging()
 
     try:
-        # Read JSON from stdin
+        # Read JSON from stdin as raw bytes so the parser can skip the text
+        # decode (falls back to text when stdin has been replaced)
         logger.debug("Reading JSON from stdin")
-        input_data = sys.stdin.read()
+        input_data = getattr(sys.stdin, "buffer", sys.stdin).read()
 
         # Create StatusLine facade and generate output
         statusline = StatusLine()
@@ -0,0 +1,35 @@
+"""Shared pytest fixtures."""
+import pytest
+import sys
+from pathlib import Path
+
+# Add src directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+import colors
+
+
+@pytest.fixture(autouse=True)
+def reset_color_cache():
+    """Re-read NO_COLOR in every test, since tests change it via monkeypatch."""
+    colors._invalidate_color_cache()
+    yield
+    colors._invalidate_color_cache()
+
+
+@pytest.fixture(autouse=True)
+def isolate_git_cache(tmp_path, monkeypatch):
+    """Keep the cross-run git and system caches out of the real config directory."""
+    import data_extractor
+    monkeypatch.setattr(data_extractor, "GIT_CACHE_FILE", tmp_path / "git.cache.pickle")
+    monkeypatch.setattr(data_extractor, "SYSTEM_CACHE_FILE", tmp_path / "system.cache.pickle")
+    monkeypatch.setattr(data_extractor, "_git_cache", None)
+
+
+@pytest.fixture(autouse=True)
+def reset_git_dir_cache():
+    """Forget resolved git directories, since tests build repos on the fly."""
+    import git_utils
+    git_utils.get_git_dir.cache_clear()
+    yield
+    git_utils.get_git_dir.cache_clear()
@@ -7,7 +7,7 @@ from pathlib import Path
 # Add src directory to path
 sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
 
-from colors import colorize, is_color_enabled, reset, COLORS
+from colors import colorize, is_color_enabled, reset, COLORS, _invalidate_color_cache
 
 
 class TestColorize:
@@ -31,6 +31,12 @@ class TestColorize:
         result = colorize("test", "invalid_color")
         assert result == "test"
 
+    def test_colorize_mixed_case_color(self, monkeypatch):
+        """Test colorize accepts color names regardless of case."""
+        monkeypatch.delenv("NO_COLOR", raising=False)
+        result = colorize("test", "Cyan")
+        assert result == f"{COLORS['cyan']}test{COLORS['reset']}"
+
     def test_colorize_all_colors(self, monkeypatch):
         """Test all defined colors work correctly."""
         monkeypatch.delenv("NO_COLOR", raising=False)
@@ -64,6 +70,17 @@ class TestIsColorEnabled:
         monkeypatch.setenv("NO_COLOR", "")
         assert is_color_enabled() is False
 
+    def test_no_color_read_once(self, monkeypatch):
+        """Test NO_COLOR is cached until the cache is invalidated."""
+        monkeypatch.delenv("NO_COLOR", raising=False)
+        assert is_color_enabled() is True
+
+        monkeypatch.setenv("NO_COLOR", "1")
+        assert is_color_enabled() is True
+
+        _invalidate_color_cache()
+        assert is_color_enabled() is False
+
 
 class TestReset:
     """Tests for reset function."""
@@ -17,6 +17,7 @@ from config_manager import (
     CONFIG_FILE
 )
 import constants
+import json_utils
 
 
 class TestGetDefaultConfig:
@@ -68,6 +69,36 @@ class TestGetDefaultConfig:
         assert "progress_bar_filled" in colors  # Special key
 
 
+    def test_readonly_defaults_match(self):
+        """Test the shared read-only defaults match get_default_config."""
+        from config_manager import ConfigManager
+        readonly = ConfigManager.get_default_config_readonly()
+        config = get_default_config()
+        assert readonly["display_mode"] == config["display_mode"]
+        assert dict(readonly["colors"]) == config["colors"]
+        assert list(readonly["field_order"]) == config["field_order"]
+
+    def test_readonly_defaults_immutable(self):
+        """Test the shared read-only defaults cannot be modified."""
+        from config_manager import ConfigManager
+        readonly = ConfigManager.get_default_config_readonly()
+        with pytest.raises(TypeError):
+            readonly["display_mode"] = "verbose"
+        with pytest.raises(TypeError):
+            readonly["colors"]["model"] = "red"
+
+    def test_default_sections_do_not_alias_constants(self):
+        """Test default config sections are mutable copies of the constant tables."""
+        config = get_default_config()
+        config["icons"]["model"] = "X"
+        config["visible_fields"]["model"] = False
+
+        assert constants.DEFAULT_ICONS["model"] != "X"
+        assert constants.DEFAULT_VISIBLE_FIELDS["model"] is True
+        with pytest.raises(TypeError):
+            constants.DEFAULT_COLORS["model"] = "red"
+
+
 class TestEnsureConfigExists:
     """Tests for ensure_config_exists function."""
 
@@ -198,6 +229,146 @@ class TestLoadConfig:
         assert test_config_file.exists()
 
 
+class TestConfigCache:
+    """Tests for the mtime-keyed config load cache."""
+
+    def _setup(self, tmp_path, monkeypatch):
+        test_config_dir = tmp_path / "test_config"
+        test_config_file = test_config_dir / "config.json"
+        monkeypatch.setattr("config_manager.CONFIG_DIR", test_config_dir)
+        monkeypatch.setattr("config_manager.CONFIG_FILE", test_config_file)
+        return test_config_file
+
+    def test_save_writes_sidecar_cache(self, tmp_path, monkeypatch):
+        """Test save writes the pickle cache next to config.json."""
+        test_config_file = self._setup(tmp_path, monkeypatch)
+
+        save_config(get_default_config())
+
+        assert (test_config_file.parent / "config.cache.pickle").exists()
+
+    def test_unchanged_file_served_from_sidecar(self, tmp_path, monkeypatch):
+        """Test a fresh process reuses the sidecar cache without parsing JSON."""
+        import config_manager
+        self._setup(tmp_path, monkeypatch)
+
+        config = get_default_config()
+        config["display_mode"] = "verbose"
+        save_config(config)
+
+        # Simulate a new process: drop the in-process cache
+        monkeypatch.setattr(config_manager, "_load_cache", {})
+        with patch("json_utils.loads", side_effect=AssertionError("parsed JSON")):
+            loaded = load_config()
+
+        assert loaded["display_mode"] == "verbose"
+
+    def test_modified_file_invalidates_cache(self, tmp_path, monkeypatch):
+        """Test editing config.json bypasses the stale cache."""
+        test_config_file = self._setup(tmp_path, monkeypatch)
+
+        save_config(get_default_config())
+        assert load_config()["display_mode"] == "compact"
+
+        config = get_default_config()
+        config["display_mode"] = "verbose"
+        config["progress_bar_width"] = 20
+        with open(test_config_file, 'w') as f:
+            json.dump(config, f)
+
+        loaded = load_config()
+        assert loaded["display_mode"] == "verbose"
+        assert loaded["progress_bar_width"] == 20
+
+    def test_touched_file_reuses_validated_config(self, tmp_path, monkeypatch):
+        """Test a new mtime with identical contents skips re-parsing."""
+        import os
+        test_config_file = self._setup(tmp_path, monkeypatch)
+
+        save_config(get_default_config())
+        st = os.stat(test_config_file)
+        os.utime(test_config_file, ns=(st.st_atime_ns, st.st_mtime_ns + 10**9))
+
+        with patch("json_utils.loads", side_effect=AssertionError("parsed JSON")):
+            loaded = load_config()
+
+        assert loaded == get_default_config()
+
+    def test_partial_save_caches_merged_config(self, tmp_path, monkeypatch):
+        """Test the cache written on save includes merged defaults."""
+        self._setup(tmp_path, monkeypatch)
+
+        save_config({"display_mode": "verbose"})
+        loaded = load_config()
+
+        assert loaded["display_mode"] == "verbose"
+        assert loaded["icons"] == constants.DEFAULT_ICONS
+
+    def test_load_after_save_uses_in_process_cache(self, tmp_path, monkeypatch):
+        """Test loading right after a save reads neither JSON nor the sidecar."""
+        self._setup(tmp_path, monkeypatch)
+
+        config = get_default_config()
+        config["progress_bar_width"] = 25
+        save_config(config)
+
+        with patch("json_utils.loads", side_effect=AssertionError("parsed JSON")), \
+                patch("pickle.load", side_effect=AssertionError("read sidecar")):
+            loaded = load_config()
+
+        assert loaded["progress_bar_width"] == 25
+
+    def test_cached_config_is_a_copy(self, tmp_path, monkeypatch):
+        """Test mutating a loaded config does not leak into later loads."""
+        self._setup(tmp_path, monkeypatch)
+
+        save_config(get_default_config())
+        first = load_config()
+        first["visible_fields"]["model"] = False
+
+        assert load_config()["visible_fields"]["model"] is True
+
+    def test_loaded_keys_are_interned(self, tmp_path, monkeypatch):
+        """Test keys read back from JSON and the sidecar are interned."""
+        import config_manager
+        self._setup(tmp_path, monkeypatch)
+
+        save_config(get_default_config())
+        for drop_sidecar in (False, True):
+            monkeypatch.setattr(config_manager, "_load_cache", {})
+            if drop_sidecar:
+                (tmp_path / "test_config" / "config.cache.pickle").unlink()
+            loaded = load_config()
+
+            assert all(key is sys.intern(key) for key in loaded["colors"])
+            assert all(name is sys.intern(name) for name in loaded["field_order"])
+
+    def test_corrupt_sidecar_is_ignored(self, tmp_path, monkeypatch):
+        """Test an unreadable cache file falls back to parsing JSON."""
+        import config_manager
+        test_config_file = self._setup(tmp_path, monkeypatch)
+
+        save_config(get_default_config())
+        (test_config_file.parent / "config.cache.pickle").write_bytes(b"not a pickle")
+        monkeypatch.setattr(config_manager, "_load_cache", {})
+
+        assert load_config() == get_default_config()
+
+    def test_schema_change_invalidates_sidecar(self, tmp_path, monkeypatch):
+        """Test a cache written under older defaults or rules is not reused."""
+        import config_manager
+        self._setup(tmp_path, monkeypatch)
+
+        save_config(get_default_config())
+
+        # Simulate upgrading to a release with a different schema
+        monkeypatch.setattr(config_manager, "_load_cache", {})
+        monkeypatch.setattr(config_manager, "_CACHE_VERSION", "upgraded")
+        with patch("json_utils.loads", wraps=json_utils.loads) as mock_loads:
+            assert load_config() == get_default_config()
+            assert mock_loads.called
+
+
 class TestSaveConfig:
     """Tests for save_config function."""
 
@@ -219,6 +390,85 @@ class TestSaveConfig:
 
         assert loaded["display_mode"] == "verbose"
 
+    def test_unchanged_config_not_rewritten(self, tmp_path, monkeypatch):
+        """Test saving an identical config leaves the file untouched."""
+        import os
+        test_config_dir = tmp_path / "test_config"
+        test_config_file = test_config_dir / "config.json"
+
+        monkeypatch.setattr("config_manager.CONFIG_DIR", test_config_dir)
+        monkeypatch.setattr("config_manager.CONFIG_FILE", test_config_file)
+
+        save_config(get_default_config())
+        os.utime(test_config_file, ns=(0, 0))
+
+        save_config(get_default_config())
+        assert os.stat(test_config_file).st_mtime_ns == 0
+
+        config = get_default_config()
+        config["display_mode"] = "verbose"
+        save_config(config)
+        assert os.stat(test_config_file).st_mtime_ns != 0
+
+    def test_save_keeps_symlinked_config(self, tmp_path, monkeypatch):
+        """Test saving through a symlinked config.json updates the link target."""
+        test_config_dir = tmp_path / "test_config"
+        test_config_dir.mkdir()
+        test_config_file = test_config_dir / "config.json"
+        target = tmp_path / "dotfiles" / "statusline.json"
+        target.parent.mkdir()
+        target.write_text("{}")
+        test_config_file.symlink_to(target)
+
+        monkeypatch.setattr("config_manager.CONFIG_DIR", test_config_dir)
+        monkeypatch.setattr("config_manager.CONFIG_FILE", test_config_file)
+
+        config = get_default_config()
+        config["display_mode"] = "verbose"
+        save_config(config)
+
+        assert test_config_file.is_symlink()
+        assert json.loads(target.read_text())["display_mode"] == "verbose"
+
+    def test_save_keeps_file_mode(self, tmp_path, monkeypatch):
+        """Test saving preserves the permissions of an existing config.json."""
+        import os
+        import stat
+        test_config_dir = tmp_path / "test_config"
+        test_config_file = test_config_dir / "config.json"
+
+        monkeypatch.setattr("config_manager.CONFIG_DIR", test_config_dir)
+        monkeypatch.setattr("config_manager.CONFIG_FILE", test_config_file)
+
+        save_config(get_default_config())
+        os.chmod(test_config_file, 0o600)
+
+        config = get_default_config()
+        config["display_mode"] = "verbose"
+        save_config(config)
+
+        assert stat.S_IMODE(os.stat(test_config_file).st_mode) == 0o600
+
+    def test_failed_write_removes_temp_file(self, tmp_path, monkeypatch):
+        """Test a failed replace leaves no temp file and the old config intact."""
+        test_config_dir = tmp_path / "test_config"
+        test_config_file = test_config_dir / "config.json"
+
+        monkeypatch.setattr("config_manager.CONFIG_DIR", test_config_dir)
+        monkeypatch.setattr("config_manager.CONFIG_FILE", test_config_file)
+
+        save_config(get_default_config())
+        original = test_config_file.read_bytes()
+
+        config = get_default_config()
+        config["display_mode"] = "verbose"
+        with patch("os.replace", side_effect=OSError("replace failed")):
+            with pytest.raises(OSError):
+                save_config(config)
+
+        assert test_config_file.read_bytes() == original
+        assert not list(test_config_dir.glob("*.tmp"))
+
     def test_creates_directory_if_missing(self, tmp_path, monkeypatch):
         """Test creates config directory when saving."""
         test_config_dir = tmp_path / "test_config"
@@ -275,6 +525,12 @@ class TestValidateConfig:
         assert result["colors"]["model"] == constants.COLOR_BLUE
         assert result["colors"]["cost"] == "blue"
 
+    def test_non_string_color(self):
+        """Test validates colors of the wrong type."""
+        config = {"colors": {"model": ["blue"]}}
+        result = validate_config(config)
+        assert result["colors"]["model"] == constants.COLOR_BLUE
+
     def test_invalid_field_names_in_order(self):
         """Test validates and removes invalid field names."""
         config = {
@@ -296,6 +552,16 @@ class TestValidateConfig:
         for field in constants.VALID_FIELD_NAMES:
             assert field in result["field_order"]
 
+    def test_merge_defaults_fills_and_validates(self):
+        """Test merging defaults and validating happen in one call."""
+        from config_manager import ConfigManager
+        config = {"display_mode": "verbose", "colors": {"model": "invalid_color"}, "progress_bar_width": 99}
+        result = ConfigManager().validate(config, merge_defaults=True)
+
+        expected = get_default_config()
+        expected["display_mode"] = "verbose"
+        assert result == expected
+
     def test_valid_config_unchanged(self):
         """Test that valid config passes through unchanged."""
         config = get_default_config()
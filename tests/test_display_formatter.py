@@ -52,6 +52,16 @@ class TestFormatProgressBar:
         result = format_progress_bar(50, 10, config)
         assert result == ""
 
+    def test_progress_bar_follows_color_state(self, monkeypatch):
+        """Test a cached bar is not reused after colors are disabled."""
+        monkeypatch.delenv("NO_COLOR", raising=False)
+        config = get_default_config()
+        colored = format_progress_bar(50, 10, config)
+        monkeypatch.setattr("colors._color_override", False)
+        plain = format_progress_bar(50, 10, config)
+        assert "\033[" in colored
+        assert plain == "[=====-----]"
+
 
 class TestFormatField:
     """Tests for format_field function."""
@@ -8,7 +8,7 @@ from unittest.mock import Mock, patch, mock_open
 # Add src directory to path
 sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
 
-from git_utils import get_git_branch, get_git_status, _is_git_dirty, _get_ahead_behind, get_pr_status
+from git_utils import get_git_branch, get_git_status, get_head_mtime, _is_git_dirty, _get_ahead_behind, get_pr_status
 from colors import colorize
 import constants
 
@@ -36,6 +36,18 @@ class TestGetGitBranch:
         result = get_git_branch(str(tmp_path))
         assert result == "feature/awesome-feature"
 
+    def test_get_branch_from_subdirectory(self, tmp_path):
+        """Test reading .git/HEAD from a parent of the working directory."""
+        git_dir = tmp_path / ".git"
+        git_dir.mkdir()
+        (git_dir / "HEAD").write_text("ref: refs/heads/main\n")
+        subdir = tmp_path / "src" / "pkg"
+        subdir.mkdir(parents=True)
+
+        with patch('subprocess.run', side_effect=AssertionError("ran git")):
+            result = get_git_branch(str(subdir))
+        assert result == "main"
+
     def test_detached_head_state(self, tmp_path):
         """Test handling detached HEAD (returns short commit hash)."""
         git_dir = tmp_path / ".git"
@@ -114,6 +126,39 @@ class TestGetGitBranch:
                 assert result == ""
 
 
+class TestGetHeadMtime:
+    """Tests for get_head_mtime function."""
+
+    def test_head_mtime_from_subdirectory(self, tmp_path):
+        """Test finds HEAD in a parent of the working directory."""
+        import os
+        git_dir = tmp_path / ".git"
+        git_dir.mkdir()
+        head_file = git_dir / "HEAD"
+        head_file.write_text("ref: refs/heads/main\n")
+        subdir = tmp_path / "src"
+        subdir.mkdir()
+
+        assert get_head_mtime(str(subdir)) == os.stat(head_file).st_mtime_ns
+
+    def test_head_mtime_for_worktree(self, tmp_path):
+        """Test follows a worktree .git file to the actual HEAD."""
+        import os
+        actual_git_dir = tmp_path / "actual-git"
+        actual_git_dir.mkdir()
+        head_file = actual_git_dir / "HEAD"
+        head_file.write_text("ref: refs/heads/worktree-branch\n")
+        workspace = tmp_path / "worktree"
+        workspace.mkdir()
+        (workspace / ".git").write_text("gitdir: ../actual-git\n")
+
+        assert get_head_mtime(str(workspace)) == os.stat(head_file).st_mtime_ns
+
+    def test_no_git_repository(self, tmp_path):
+        """Test returns None outside a git repository."""
+        assert get_head_mtime(str(tmp_path)) is None
+
+
 class TestIsGitDirty:
     """Tests for _is_git_dirty function."""
 
@@ -281,6 +326,24 @@ class TestGetGitStatus:
             expected = colorize("✓", constants.COLOR_GREEN)
             assert result == expected
 
+    def test_skips_rev_parse_with_git_directory(self, tmp_path):
+        """Test does not shell out to rev-parse when .git is present."""
+        (tmp_path / ".git").mkdir()
+
+        mock_status = Mock()
+        mock_status.returncode = 0
+        mock_status.stdout = ""
+
+        mock_rev_list = Mock()
+        mock_rev_list.returncode = 0
+        mock_rev_list.stdout = "0\t0\n"
+
+        with patch('subprocess.run', side_effect=[mock_status, mock_rev_list]) as mock_run:
+            result = get_git_status(str(tmp_path))
+            expected = colorize("✓", constants.COLOR_GREEN)
+            assert result == expected
+            assert mock_run.call_count == 2
+
     def test_dirty_repository(self, tmp_path):
         """Test shows star for dirty repository."""
         mock_rev_parse = Mock()
@@ -372,6 +372,26 @@ class TestInstallationHelper:
             assert settings["nested"]["key"] == "value"
             assert "statusLine" in settings
 
+    def test_install_helper_uses_json_utils_backend(self, monkeypatch):
+        """Test that install_helper.py reads and writes through json_utils."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            settings_file = Path(tmpdir) / "settings.json"
+            settings_file.write_text('{"someOtherSetting": "value"}')
+
+            helper_path = Path(__file__).parent.parent / "install_helper.py"
+            sys.path.insert(0, str(helper_path.parent))
+            import install_helper
+            import json_utils
+
+            calls = []
+            real_loads, real_dumps = json_utils.loads, json_utils.dumps
+            monkeypatch.setattr(json_utils, "loads", lambda raw: calls.append("loads") or real_loads(raw))
+            monkeypatch.setattr(json_utils, "dumps", lambda obj: calls.append("dumps") or real_dumps(obj))
+
+            assert install_helper.update_claude_settings(settings_file) == 0
+            assert calls == ["loads", "dumps"]
+            assert json.loads(settings_file.read_text())["someOtherSetting"] == "value"
+
     def test_install_helper_config_creation(self):
         """Test that install_helper.py can create default config."""
         with tempfile.TemporaryDirectory() as tmpdir:
@@ -0,0 +1,97 @@
+"""Tests for json_utils module."""
+import json
+import pytest
+import sys
+from pathlib import Path
+
+# Add src directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+import json_utils
+
+
+class _StubOrjson:
+    """Minimal stand-in for orjson that records calls and defers to json."""
+
+    OPT_INDENT_2 = 1
+
+    class JSONDecodeError(json.JSONDecodeError):
+        pass
+
+    def __init__(self):
+        self.calls = []
+
+    def loads(self, raw):
+        self.calls.append("loads")
+        if isinstance(raw, bytes):
+            try:
+                raw = raw.decode("utf-8")
+            except UnicodeDecodeError as e:
+                # orjson reports invalid UTF-8 as a JSONDecodeError
+                raise self.JSONDecodeError(str(e), "", 0)
+        try:
+            return json.loads(raw)
+        except json.JSONDecodeError as e:
+            raise self.JSONDecodeError(e.msg, e.doc, e.pos)
+
+    def dumps(self, obj, option=None):
+        self.calls.append(("dumps", option))
+        # orjson always writes raw UTF-8
+        return json.dumps(obj, indent=2, ensure_ascii=False).encode("utf-8")
+
+
+@pytest.fixture(params=["stdlib", "orjson"])
+def backend(request, monkeypatch):
+    """Run a test against the stdlib fallback and a stubbed orjson."""
+    stub = _StubOrjson() if request.param == "orjson" else None
+    monkeypatch.setattr(json_utils, "orjson", stub)
+    return stub
+
+
+class TestLoads:
+    """Tests for loads function."""
+
+    def test_loads_bytes(self, backend):
+        """Test parses UTF-8 encoded JSON."""
+        assert json_utils.loads(b'{"model": "claude"}') == {"model": "claude"}
+
+    def test_loads_text(self, backend):
+        """Test parses decoded JSON text."""
+        assert json_utils.loads('{"model": "claude"}') == {"model": "claude"}
+
+    def test_invalid_json_raises_json_decode_error(self, backend):
+        """Test malformed JSON raises the stdlib-compatible error."""
+        with pytest.raises(json_utils.JSONDecodeError):
+            json_utils.loads(b"invalid json")
+
+    def test_invalid_utf8_is_replaced(self, backend):
+        """Test undecodable bytes are replaced instead of failing."""
+        assert json_utils.loads(b'{"model": "\xff"}') == {"model": "�"}
+
+    def test_uses_orjson_when_installed(self, backend):
+        """Test the orjson backend is used when available."""
+        json_utils.loads(b"{}")
+        if backend is not None:
+            assert backend.calls == ["loads"]
+
+
+class TestDumps:
+    """Tests for dumps function."""
+
+    def test_dumps_round_trips(self, backend):
+        """Test output is indented UTF-8 JSON."""
+        data = json_utils.dumps({"model": "claude"})
+        assert isinstance(data, bytes)
+        assert json.loads(data) == {"model": "claude"}
+        assert b'\n  "model"' in data
+
+    def test_uses_orjson_indent_option(self, backend):
+        """Test the orjson backend is asked for two-space indentation."""
+        json_utils.dumps({})
+        if backend is not None:
+            assert backend.calls == [("dumps", backend.OPT_INDENT_2)]
+
+    def test_non_ascii_written_as_utf8(self, backend):
+        """Test both backends write the same raw UTF-8 bytes for emoji icons."""
+        data = json_utils.dumps({"icon": "🤖"})
+        assert data == '{\n  "icon": "🤖"\n}'.encode("utf-8")
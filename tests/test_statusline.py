@@ -4,7 +4,7 @@ import pytest
 import sys
 from pathlib import Path
 from unittest.mock import patch, MagicMock
-from io import StringIO
+from io import BytesIO, StringIO, TextIOWrapper
 
 # Add src directory to path
 sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
@@ -186,6 +186,141 @@ class TestExtractData:
                 assert isinstance(result[field], str)
 
 
+    def test_extract_datetime_format(self):
+        """Test datetime is local time formatted as YYYY-MM-DD HH:MM:SS."""
+        import re
+        result = extract_data({}, {})
+        assert re.fullmatch(r"\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2}", result["datetime"])
+
+class TestExtractVisibleFields:
+    """Tests for skipping expensive extraction of hidden fields."""
+
+    def test_hidden_git_branch_skips_git(self, tmp_path):
+        """Test git is not queried when git_branch is hidden."""
+        json_data = {"workspace": {"current_dir": str(tmp_path)}}
+        config = {"visible_fields": {"current_dir": True, "git_branch": False}}
+        with patch("git_utils.get_git_branch", side_effect=AssertionError("ran git")):
+            result = extract_data(json_data, config)
+        assert result["current_dir"] == tmp_path.name
+        assert "git_branch" not in result
+
+    def test_hidden_system_fields_not_sampled(self):
+        """Test only visible system metrics are sampled."""
+        config = {"visible_fields": {"memory_usage": True, "cpu_usage": False}}
+        with patch("system_utils.get_cpu_usage", side_effect=AssertionError("sampled CPU")), \
+                patch("system_utils.get_battery_status", side_effect=AssertionError("read battery")), \
+                patch("system_utils.get_memory_usage", return_value="42%"):
+            result = extract_data({}, config)
+        assert result["memory_usage"] == "42%"
+        assert "python_version" not in result
+        assert "datetime" not in result
+
+    def test_config_without_visibility_extracts_everything(self):
+        """Test a config with no visible_fields section extracts all fields."""
+        result = extract_data({}, {})
+        assert "python_version" in result
+        assert "datetime" in result
+
+
+class TestGitCache:
+    """Tests for the cross-run git branch/status cache."""
+
+    def _workspace(self, tmp_path, branch="main"):
+        repo = tmp_path / "repo"
+        (repo / ".git").mkdir(parents=True)
+        (repo / ".git" / "HEAD").write_text(f"ref: refs/heads/{branch}\n")
+        return {"workspace": {"current_dir": str(repo)}}
+
+    def test_repeat_render_skips_git_queries(self, tmp_path):
+        """Test a second render within the TTL reuses the cached result."""
+        json_data = self._workspace(tmp_path)
+        with patch("git_utils.get_git_status", return_value="") as status, \
+                patch("git_utils.get_pr_status", return_value=""):
+            assert extract_data(json_data, {})["git_branch"] == "main"
+            assert extract_data(json_data, {})["git_branch"] == "main"
+        assert status.call_count == 1
+
+    def test_cache_survives_new_process(self, tmp_path, monkeypatch):
+        """Test the sidecar file serves a fresh process without git calls."""
+        import data_extractor
+        json_data = self._workspace(tmp_path)
+        with patch("git_utils.get_git_status", return_value=""), \
+                patch("git_utils.get_pr_status", return_value=""):
+            extract_data(json_data, {})
+
+        monkeypatch.setattr(data_extractor, "_git_cache", None)
+        with patch("git_utils.get_git_branch", side_effect=AssertionError("ran git")):
+            assert extract_data(json_data, {})["git_branch"] == "main"
+
+    def test_branch_switch_invalidates_cache(self, tmp_path):
+        """Test a change to .git/HEAD forces a fresh query."""
+        import os
+        json_data = self._workspace(tmp_path)
+        head = tmp_path / "repo" / ".git" / "HEAD"
+        with patch("git_utils.get_git_status", return_value=""), \
+                patch("git_utils.get_pr_status", return_value=""):
+            extract_data(json_data, {})
+            head.write_text("ref: refs/heads/feature\n")
+            st = os.stat(head)
+            os.utime(head, ns=(st.st_atime_ns, st.st_mtime_ns + 10**9))
+            assert extract_data(json_data, {})["git_branch"] == "feature"
+
+    def test_branch_switch_invalidates_cache_in_subdirectory(self, tmp_path):
+        """Test HEAD changes are seen when the workspace is inside the repo."""
+        import os
+        self._workspace(tmp_path)
+        subdir = tmp_path / "repo" / "src" / "pkg"
+        subdir.mkdir(parents=True)
+        json_data = {"workspace": {"current_dir": str(subdir)}}
+        head = tmp_path / "repo" / ".git" / "HEAD"
+        with patch("git_utils.get_git_status", return_value=""), \
+                patch("git_utils.get_pr_status", return_value=""):
+            assert extract_data(json_data, {})["git_branch"] == "main"
+            head.write_text("ref: refs/heads/feature\n")
+            st = os.stat(head)
+            os.utime(head, ns=(st.st_atime_ns, st.st_mtime_ns + 10**9))
+            assert extract_data(json_data, {})["git_branch"] == "feature"
+
+    def test_expired_entry_is_refreshed(self, tmp_path):
+        """Test entries older than the TTL are queried again."""
+        json_data = self._workspace(tmp_path)
+        with patch("git_utils.get_git_status", return_value="") as status, \
+                patch("git_utils.get_pr_status", return_value=""), \
+                patch("data_extractor.time.time", side_effect=[1000.0, 1000.0 + 60]):
+            # Only the git field, so system sampling doesn't read the clock
+            config = {"visible_fields": {"git_branch": True}}
+            extract_data(json_data, config)
+            extract_data(json_data, config)
+        assert status.call_count == 2
+
+
+class TestSystemCache:
+    """Tests for the cross-run CPU/memory/battery cache."""
+
+    CONFIG = {"visible_fields": {"cpu_usage": True, "battery": True}}
+
+    def _render_at(self, now):
+        with patch("system_utils.get_cpu_usage", return_value="12%") as cpu, \
+                patch("system_utils.get_battery_status", return_value="80%") as battery, \
+                patch("data_extractor.time.time", return_value=now):
+            result = extract_data({}, self.CONFIG)
+        return result, cpu.call_count, battery.call_count
+
+    def test_repeat_render_reuses_samples(self):
+        """Test a render within the TTLs samples nothing."""
+        self._render_at(1000.0)
+        result, cpu_calls, battery_calls = self._render_at(1000.5)
+        assert (cpu_calls, battery_calls) == (0, 0)
+        assert result["cpu_usage"] == "12%"
+        assert result["battery"] == "80%"
+
+    def test_metrics_expire_independently(self):
+        """Test CPU is resampled before the slower-moving battery."""
+        self._render_at(1000.0)
+        _, cpu_calls, battery_calls = self._render_at(1002.0)
+        assert (cpu_calls, battery_calls) == (1, 0)
+
+
 class TestMain:
     """Tests for main function."""
 
@@ -212,6 +347,41 @@ class TestMain:
                 output = mock_stdout.getvalue()
                 assert len(output) > 0
 
+    def test_main_reads_stdin_bytes(self, monkeypatch, tmp_path):
+        """Test main parses raw bytes from the stdin buffer."""
+        monkeypatch.delenv("NO_COLOR", raising=False)
+
+        test_input = json.dumps({
+            "model": {"id": "claude-sonnet-4"},
+            "workspace": {"current_dir": str(tmp_path)}
+        }).encode("utf-8")
+
+        test_config_dir = tmp_path / "config"
+        monkeypatch.setattr("config_manager.CONFIG_DIR", test_config_dir)
+        monkeypatch.setattr("config_manager.CONFIG_FILE", test_config_dir / "config.json")
+
+        stdin = TextIOWrapper(BytesIO(test_input), encoding="utf-8")
+        with patch('sys.stdin', stdin):
+            with patch('sys.stdout', new=StringIO()) as mock_stdout:
+                main()
+                assert "claude-sonnet-4" in mock_stdout.getvalue()
+
+    def test_main_with_invalid_utf8(self, monkeypatch, tmp_path):
+        """Test main replaces undecodable stdin bytes instead of failing."""
+        monkeypatch.delenv("NO_COLOR", raising=False)
+
+        test_input = b'{"model": {"id": "claude-\xff"}, "version": "v1.0.0"}'
+
+        test_config_dir = tmp_path / "config"
+        monkeypatch.setattr("config_manager.CONFIG_DIR", test_config_dir)
+        monkeypatch.setattr("config_manager.CONFIG_FILE", test_config_dir / "config.json")
+
+        stdin = TextIOWrapper(BytesIO(test_input), encoding="utf-8")
+        with patch('sys.stdin', stdin):
+            with patch('sys.stdout', new=StringIO()) as mock_stdout:
+                main()
+                assert "claude-�" in mock_stdout.getvalue()
+
     def test_main_with_invalid_json(self, monkeypatch, capsys):
         """Test main function handles invalid JSON."""
         with patch('sys.stdin', StringIO("invalid json")):